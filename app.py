@@ -4,6 +4,7 @@ CostByte - Advanced Business Intelligence Platform
 Military-Grade Security, Self-Healing, Self-Funding, Self-Learning
 """
 
+import asyncio
 import logging
 import sys
 from datetime import datetime
@@ -169,9 +170,6 @@ class CostBytePlatform:
     def start_platform_services(self):
         """Start all platform services"""
         try:
-            # Start continuous monitoring
-            self.system_monitor.start_continuous_monitoring()
-            
             # Start background services
             self.start_background_services()
             
@@ -197,15 +195,14 @@ class CostBytePlatform:
                     self.logger.error(f"Funding processor error: {e}")
                     time.sleep(3600)  # Retry in 1 hour
         
-        def health_monitor():
-            while True:
-                try:
-                    # Run health checks every 5 minutes
-                    self.auto_recovery.run_health_check_cycle()
-                    time.sleep(300)  # 5 minutes
-                except Exception as e:
-                    self.logger.error(f"Health monitor error: {e}")
-                    time.sleep(300)  # Continue after error
+        async def monitoring():
+            # One event loop drives system monitoring (every minute)
+            # and health checks (every 5 minutes)
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                self.system_monitor.schedule(loop),
+                self.auto_recovery.schedule(loop, interval=300)
+            )
         
         def ai_optimizer():
             while True:
@@ -221,7 +218,7 @@ class CostBytePlatform:
         
         # Start background threads
         threading.Thread(target=funding_processor, daemon=True).start()
-        threading.Thread(target=health_monitor, daemon=True).start()
+        threading.Thread(target=asyncio.run, args=(monitoring(),), daemon=True).start()
         threading.Thread(target=ai_optimizer, daemon=True).start()
         
         self.logger.info("✅ Background services started")
@@ -298,6 +295,10 @@ class CostBytePlatform:
         
         return status
     
+    def reset_service_recovery(self, service_name):
+        """Re-enable automatic recovery for a service after manual intervention"""
+        self.auto_recovery.reset_recovery_attempts(service_name)
+    
     def run_daily_business_cycle(self):
         """Run complete daily business cycle"""
         self.logger.info("Starting daily business cycle...")
@@ -3,8 +3,8 @@ import time
 from datetime import datetime
 import logging
 from typing import Dict, List
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 
 class OutreachAgent:
     def __init__(self, email_manager, db_connection):
@@ -2,7 +2,6 @@ import logging
 from datetime import datetime
 from typing import Dict, List
 import requests
-from bs4 import BeautifulSoup
 
 class ResearchAgent:
     def __init__(self, db_connection):
@@ -135,6 +134,8 @@ class ResearchAgent:
     def _analyze_website(self, website: str) -> Dict:
         """Analyze company website for insights"""
         try:
+            # Only website analysis needs the HTML parser
+            from bs4 import BeautifulSoup
             response = requests.get(website, timeout=10)
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -1,9 +1,23 @@
 import logging
 import sqlite3
-import mysql.connector
 from pathlib import Path
 from typing import Dict, List
 
+_INSERT_LEAD = '''
+    INSERT OR REPLACE INTO leads 
+    (id, company_name, contact_email, contact_name, industry, size, location, lead_score, status, priority, source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _lead_row(lead_data: Dict) -> tuple:
+    """Column values for _INSERT_LEAD"""
+    return (
+        lead_data['id'], lead_data['company_name'], lead_data['contact_email'],
+        lead_data.get('contact_name', ''), lead_data['industry'], lead_data['size'],
+        lead_data['location'], lead_data['lead_score'], lead_data['status'],
+        lead_data['priority'], lead_data['source']
+    )
+
 class DatabaseHandler:
     def __init__(self, config: Dict, use_sqlite: bool = True):
         self.config = config
@@ -15,13 +29,17 @@ class DatabaseHandler:
         """Connect to database"""
         try:
             if self.use_sqlite:
-                # For local development
-                db_path = Path(__file__).parent.parent.parent / 'data' / 'ai_business.db'
-                db_path.parent.mkdir(parents=True, exist_ok=True)
-                self.connection = sqlite3.connect(db_path)
+                # For local development; sqlite_path overrides the data/ file
+                # (e.g. ':memory:' or, with uri=True, a file: URI for tests)
+                db_path = self.config.get('sqlite_path')
+                if db_path is None:
+                    db_path = Path(__file__).parent.parent.parent / 'data' / 'ai_business.db'
+                    db_path.parent.mkdir(parents=True, exist_ok=True)
+                self.connection = sqlite3.connect(db_path, uri=self.config.get('uri', False))
                 self.logger.info("Connected to SQLite database")
             else:
-                # For production (MySQL)
+                # For production (MySQL); the driver is only needed here
+                import mysql.connector
                 self.connection = mysql.connector.connect(**self.config)
                 self.logger.info("Connected to MySQL database")
             
@@ -136,22 +154,25 @@ class DatabaseHandler:
         """Insert a new lead"""
         try:
             cursor = self.connection.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO leads 
-                (id, company_name, contact_email, contact_name, industry, size, location, lead_score, status, priority, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                lead_data['id'], lead_data['company_name'], lead_data['contact_email'],
-                lead_data.get('contact_name', ''), lead_data['industry'], lead_data['size'],
-                lead_data['location'], lead_data['lead_score'], lead_data['status'],
-                lead_data['priority'], lead_data['source']
-            ))
+            cursor.execute(_INSERT_LEAD, _lead_row(lead_data))
             self.connection.commit()
             return True
         except Exception as e:
             self.logger.error(f"Error inserting lead: {e}")
             return False
     
+    def insert_leads(self, leads: List[Dict]) -> bool:
+        """Insert many leads with one executemany in a single transaction"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany(_INSERT_LEAD, [_lead_row(lead_data) for lead_data in leads])
+            self.connection.commit()
+            return True
+        except Exception as e:
+            self.connection.rollback()
+            self.logger.error(f"Error inserting leads: {e}")
+            return False
+    
     def get_leads(self, status: str = None, priority: str = None, limit: int = 100) -> List[Dict]:
         """Get leads with optional filters"""
         try:
@@ -1,9 +1,12 @@
 import smtplib
 import logging
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+import re
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 from typing import Dict, List
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 class EmailManager:
     def __init__(self, email_config: Dict):
         self.config = email_config
@@ -15,16 +18,16 @@ class EmailManager:
         """Send email using SMTP configuration"""
         try:
             # Create message
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg['From'] = self.config['username']
             msg['To'] = to_email
             msg['Subject'] = subject
             
             # Add body
             if is_html:
-                msg.attach(MimeText(body, 'html'))
+                msg.attach(MIMEText(body, 'html'))
             else:
-                msg.attach(MimeText(body, 'plain'))
+                msg.attach(MIMEText(body, 'plain'))
             
             # Send email
             with smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port']) as server:
@@ -101,9 +104,7 @@ class EmailManager:
     
     def validate_email(self, email: str) -> bool:
         """Basic email validation"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     def create_email_template(self, template_name: str, variables: Dict) -> str:
         """Create email template with variables"""
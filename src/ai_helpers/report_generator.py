@@ -1,18 +1,28 @@
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, TypedDict
 import json
 
+class DailyReport(TypedDict):
+    """Shape of the report returned by generate_daily_report"""
+    report_date: str
+    executive_summary: Dict
+    lead_metrics: Dict
+    campaign_metrics: Dict
+    revenue_metrics: Dict
+    system_health: Dict
+    recommendations: List[str]
+
 class ReportGenerator:
     def __init__(self, db_connection):
         self.db = db_connection
         self.logger = logging.getLogger(__name__)
     
-    def generate_daily_report(self) -> Dict:
+    def generate_daily_report(self) -> DailyReport:
         """Generate daily business report"""
         self.logger.info("Generating daily report")
         
-        report = {
+        report: DailyReport = {
             'report_date': datetime.now().strftime('%Y-%m-%d'),
             'executive_summary': {},
             'lead_metrics': {},
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 import sqlite3
@@ -5,37 +6,58 @@ from datetime import datetime, timedelta
 import threading
 
 class AutoRecovery:
+    SERVICES_TO_MONITOR = (
+        'database_connection',
+        'email_service', 
+        'api_gateway',
+        'lead_generation',
+        'payment_processing'
+    )
+    
     def __init__(self, db_connection):
         self.db = db_connection
         self.recovery_attempts = {}
         self.max_recovery_attempts = 3
+        self._exhausted = set()  # services awaiting manual intervention
+        
+        # Long-lived cursor for the liveness probe; SQLite caches the
+        # prepared statement per connection so re-executing it is cheap
+        self._PING = "SELECT 1"
+        self._hc_cursor = self.db.cursor()
+        self._hc_lock = threading.Lock()
+        
+        # PRAGMA quick_check skips the index cross-checks integrity_check
+        # does, so it keeps most of the signal at a fraction of the disk I/O;
+        # it runs every N cycles (~hourly at the 5 minute app.py cadence)
+        self.deep_check_interval = 12
+        self._cycles_since_deep_check = 0
+        
+        # Service dispatch tables, built once rather than on every check
+        self._health_checks = {
+            'database_connection': self._check_database_health,
+            'email_service': self._check_email_service,
+            'api_gateway': self._check_api_gateway,
+            'lead_generation': self._check_lead_generation,
+            'payment_processing': self._check_payment_processing
+        }
+        self._recovery_fns = {
+            'database_connection': self._recover_database,
+            'email_service': self._recover_email_service,
+            'api_gateway': self._recover_api_gateway,
+            'lead_generation': self._recover_lead_generation,
+            'payment_processing': self._recover_payment_processing
+        }
         
     def monitor_critical_services(self):
         """Monitor critical system services"""
-        services_to_monitor = [
-            'database_connection',
-            'email_service', 
-            'api_gateway',
-            'lead_generation',
-            'payment_processing'
-        ]
-        
-        for service in services_to_monitor:
+        for service in self.SERVICES_TO_MONITOR:
             status = self.check_service_health(service)
             if not status['healthy']:
                 self.attempt_service_recovery(service, status)
     
     def check_service_health(self, service_name):
         """Check health of specific service"""
-        health_checks = {
-            'database_connection': self._check_database_health,
-            'email_service': self._check_email_service,
-            'api_gateway': self._check_api_gateway,
-            'lead_generation': self._check_lead_generation,
-            'payment_processing': self._check_payment_processing
-        }
-        
-        check_function = health_checks.get(service_name)
+        check_function = self._health_checks.get(service_name)
         if check_function:
             return check_function()
         else:
@@ -43,25 +65,22 @@ class AutoRecovery:
     
     def attempt_service_recovery(self, service_name, status):
         """Attempt to recover a failed service"""
+        if service_name in self._exhausted:
+            return False
+        
         if service_name not in self.recovery_attempts:
             self.recovery_attempts[service_name] = 0
         
         if self.recovery_attempts[service_name] >= self.max_recovery_attempts:
+            # Logged once; later cycles return early until reset
+            self._exhausted.add(service_name)
             logging.error(f"Max recovery attempts reached for {service_name}. Manual intervention required.")
             return False
         
         self.recovery_attempts[service_name] += 1
         logging.warning(f"Attempting recovery for {service_name} (attempt {self.recovery_attempts[service_name]})")
         
-        recovery_functions = {
-            'database_connection': self._recover_database,
-            'email_service': self._recover_email_service,
-            'api_gateway': self._recover_api_gateway,
-            'lead_generation': self._recover_lead_generation,
-            'payment_processing': self._recover_payment_processing
-        }
-        
-        recovery_function = recovery_functions.get(service_name)
+        recovery_function = self._recovery_fns.get(service_name)
         if recovery_function:
             success = recovery_function()
             if success:
@@ -72,15 +91,41 @@ class AutoRecovery:
         logging.error(f"Failed to recover {service_name}")
         return False
     
+    def reset_recovery_attempts(self, service_name):
+        """Re-enable automatic recovery after manual intervention
+        
+        Services waiting for this are listed under 'awaiting_intervention'
+        in generate_health_report().
+        """
+        logging.info(f"Automatic recovery re-enabled for {service_name}")
+        self._exhausted.discard(service_name)
+        self.recovery_attempts[service_name] = 0
+    
     def _check_database_health(self):
         """Check database connection health"""
         try:
-            cursor = self.db.cursor()
-            cursor.execute("SELECT 1")
+            with self._hc_lock:
+                if self._hc_cursor is None:
+                    self._hc_cursor = self.db.cursor()
+                self._hc_cursor.execute(self._PING)
+                self._hc_cursor.fetchone()
             return {'healthy': True, 'message': 'Database connection OK'}
         except Exception as e:
             return {'healthy': False, 'message': f'Database error: {e}'}
     
+    def _deep_check_database(self):
+        """Verify database file integrity with a cheap quick_check"""
+        try:
+            with self._hc_lock:
+                cursor = self.db.cursor()
+                cursor.execute("PRAGMA quick_check(1)")
+                row = cursor.fetchone()
+            if row is not None and row[0] == 'ok':
+                return {'healthy': True, 'message': 'Database integrity OK'}
+            return {'healthy': False, 'message': f'Integrity problem: {row[0] if row else "no result"}'}
+        except Exception as e:
+            return {'healthy': False, 'message': f'Integrity check failed: {e}'}
+    
     def _check_email_service(self):
         """Check email service health"""
         # Implementation would test SMTP connection
@@ -116,9 +161,12 @@ class AutoRecovery:
         """Recover database connection"""
         try:
             # Close and reopen connection
+            with self._hc_lock:
+                self._hc_cursor = None
             self.db.close()
             time.sleep(2)
-            # Reconnection logic would go here
+            # Reconnection logic would go here; the health-check cursor
+            # is reopened against the new connection on the next probe
             return True
         except Exception as e:
             logging.error(f"Database recovery failed: {e}")
@@ -157,22 +205,37 @@ class AutoRecovery:
         
         # Generate health report
         report = self.generate_health_report()
+        
+        # Periodic integrity verification
+        self._cycles_since_deep_check += 1
+        if self._cycles_since_deep_check >= self.deep_check_interval:
+            self._cycles_since_deep_check = 0
+            report['database_integrity'] = self._deep_check_database()
+            if not report['database_integrity']['healthy']:
+                logging.error(f"Database integrity check failed: {report['database_integrity']['message']}")
+        
         logging.info(f"Health check cycle completed: {report['overall_status']}")
         
         return report
     
+    def schedule(self, loop, interval=300):
+        """Schedule periodic health check cycles as a task on a shared event loop"""
+        return loop.create_task(self._health_check_loop(interval))
+    
+    async def _health_check_loop(self, interval):
+        """Run a health check cycle every interval seconds"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.run_health_check_cycle)
+            except Exception as e:
+                logging.error(f"Health monitor error: {e}")
+            await asyncio.sleep(interval)
+    
     def generate_health_report(self):
         """Generate comprehensive health report"""
-        services = [
-            'database_connection',
-            'email_service', 
-            'api_gateway',
-            'lead_generation',
-            'payment_processing'
-        ]
-        
         service_status = {}
-        for service in services:
+        for service in self.SERVICES_TO_MONITOR:
             status = self.check_service_health(service)
             service_status[service] = status
         
@@ -190,5 +253,6 @@ class AutoRecovery:
             'overall_status': overall_status,
             'unhealthy_services': unhealthy_services,
             'service_details': service_status,
-            'recovery_attempts': self.recovery_attempts
+            'recovery_attempts': self.recovery_attempts,
+            'awaiting_intervention': sorted(self._exhausted)
         }
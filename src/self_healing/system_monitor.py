@@ -1,7 +1,8 @@
+import asyncio
 import psutil
 import logging
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 import threading
 
 class SystemMonitor:
@@ -15,46 +16,68 @@ class SystemMonitor:
         }
         self.monitoring_active = True
         
+        # Boot time is fixed for the process lifetime; cpu_percent is primed
+        # so later non-blocking calls report usage since the previous sample
+        self._boot_time = psutil.boot_time()
+        psutil.cpu_percent(interval=None)
+        
     def start_continuous_monitoring(self):
-        """Start continuous system monitoring"""
-        def monitor_loop():
-            while self.monitoring_active:
-                try:
-                    self.collect_system_metrics()
-                    self.check_system_health()
-                    time.sleep(60)  # Check every minute
-                except Exception as e:
-                    logging.error(f"Monitoring error: {e}")
-                    time.sleep(300)  # Wait 5 minutes on error
-        
-        monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
+        """Start continuous system monitoring on a background event loop
+        
+        Prefer schedule() when an event loop already drives other periodic jobs.
+        """
+        monitor_thread = threading.Thread(target=asyncio.run, args=(self._monitor_loop(),), daemon=True)
         monitor_thread.start()
         logging.info("Continuous system monitoring started")
     
+    def schedule(self, loop):
+        """Schedule continuous monitoring as a task on a shared event loop"""
+        logging.info("Continuous system monitoring scheduled")
+        return loop.create_task(self._monitor_loop())
+    
+    async def _monitor_loop(self):
+        """Collect metrics and check health every minute"""
+        loop = asyncio.get_running_loop()
+        while self.monitoring_active:
+            try:
+                # psutil calls block, so keep them off the event loop
+                metrics = await loop.run_in_executor(None, self.collect_system_metrics)
+                self.check_system_health(metrics)
+                await asyncio.sleep(60)  # Check every minute
+            except Exception as e:
+                logging.error(f"Monitoring error: {e}")
+                await asyncio.sleep(300)  # Wait 5 minutes on error
+    
     def collect_system_metrics(self):
         """Collect comprehensive system metrics"""
+        # Samples are keyed by the monotonic clock for internal bookkeeping;
+        # the payload keeps a wall-clock timestamp for consumers
+        now = time.monotonic()
         metrics = {
             'timestamp': datetime.now(),
-            'cpu_percent': psutil.cpu_percent(interval=1),
+            'cpu_percent': psutil.cpu_percent(interval=None),
             'memory_percent': psutil.virtual_memory().percent,
             'disk_percent': psutil.disk_usage('/').percent,
             'network_io': psutil.net_io_counters(),
             'active_processes': len(psutil.pids()),
-            'system_uptime': time.time() - psutil.boot_time()
+            'system_uptime': time.time() - self._boot_time
         }
         
         # Store metrics with timestamp
-        current_time = datetime.now()
-        self.performance_metrics[current_time] = metrics
+        self.performance_metrics[now] = metrics
         
         # Clean up old metrics (keep last 24 hours)
         self._cleanup_old_metrics()
         
         return metrics
     
-    def check_system_health(self):
-        """Check system health against thresholds"""
-        current_metrics = self.collect_system_metrics()
+    def check_system_health(self, metrics=None):
+        """Check system health against thresholds
+        
+        Pass metrics already returned by collect_system_metrics to avoid
+        sampling the system twice in the same cycle.
+        """
+        current_metrics = metrics if metrics is not None else self.collect_system_metrics()
         alerts = []
         
         # CPU Check
@@ -104,7 +127,7 @@ class SystemMonitor:
     
     def _cleanup_old_metrics(self):
         """Remove metrics older than 24 hours"""
-        cutoff_time = datetime.now() - timedelta(hours=24)
+        cutoff_time = time.monotonic() - 24 * 3600
         old_keys = [k for k in self.performance_metrics.keys() if k < cutoff_time]
         for key in old_keys:
             del self.performance_metrics[key]
@@ -116,13 +139,14 @@ class SystemMonitor:
         
         recent_metrics = list(self.performance_metrics.values())[-10:]  # Last 10 readings
         
+        hour_ago = time.monotonic() - 3600
         report = {
+            'generated_at': datetime.now(),
             'current_status': 'healthy',
             'average_cpu': sum(m['cpu_percent'] for m in recent_metrics) / len(recent_metrics),
             'average_memory': sum(m['memory_percent'] for m in recent_metrics) / len(recent_metrics),
             'system_uptime_days': recent_metrics[-1]['system_uptime'] / 86400,
-            'alerts_in_last_hour': len([k for k in self.performance_metrics.keys() 
-                                      if k > datetime.now() - timedelta(hours=1)])
+            'alerts_in_last_hour': len([k for k in self.performance_metrics.keys() if k > hour_ago])
         }
         
         # Determine overall status
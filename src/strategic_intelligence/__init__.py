@@ -0,0 +1,16 @@
+from importlib import import_module
+
+# Analyzers are imported on first access, so using one does not pay for
+# the others' dependencies (pandas, requests)
+_EXPORTS = {
+    'MarketAnalyzer': '.market_analyzer',
+    'CompetitorTracker': '.competitor_tracker',
+    'TrendPredictor': '.trend_predictor'
+}
+
+__all__ = ['MarketAnalyzer', 'CompetitorTracker', 'TrendPredictor']
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
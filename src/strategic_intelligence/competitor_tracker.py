@@ -1,14 +1,35 @@
+import asyncio
 import logging
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List
+from itertools import chain
+from typing import Dict, List, Optional
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+_SERVICE_GAPS = ('AI-Powered Lead Generation', '24/7 Lead Monitoring', 'Predictive Analytics')
+_OPPORTUNITY_AREAS = ('Vertical-specific solutions', 'SMB-focused packages', 'Performance-based pricing')
 
 class CompetitorTracker:
     def __init__(self, db_connection):
         self.db = db_connection
-        self.logger = logging.getLogger(__name__)
         self.competitors = []
+        
+        # One pooled keep-alive session for all competitor fetches, sized
+        # for the concurrent checks in track_competitor_changes_async
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
     
     def add_competitor(self, domain: str, name: str, focus_areas: List[str]):
         """Add a competitor to track"""
@@ -20,7 +41,7 @@ class CompetitorTracker:
             'last_checked': None
         }
         self.competitors.append(competitor)
-        self.logger.info(f"Added competitor: {name} ({domain})")
+        logger.info("Added competitor: %s (%s)", name, domain)
     
     def analyze_competitor_landscape(self) -> Dict:
         """Analyze the overall competitor landscape"""
@@ -38,30 +59,72 @@ class CompetitorTracker:
         return analysis
     
     def track_competitor_changes(self) -> List[Dict]:
-        """Track changes in competitor strategies"""
+        """Track changes in competitor strategies
+        
+        Synchronous callers only; code already running in an event loop
+        (e.g. alongside schedule()) must await track_competitor_changes_async().
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.track_competitor_changes_async())
+        raise RuntimeError("track_competitor_changes() cannot run inside an event loop; "
+                           "await track_competitor_changes_async() instead")
+    
+    async def track_competitor_changes_async(self) -> List[Dict]:
+        """Track changes for all competitors concurrently
+        
+        Each competitor check runs in the loop's executor so network waits
+        overlap; a failing competitor is logged without aborting the batch.
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, self._check_competitor, competitor) for competitor in self.competitors),
+            return_exceptions=True
+        )
+        
         changes = []
+        for competitor, result in zip(self.competitors, results):
+            if isinstance(result, Exception):
+                logger.error("Error tracking %s: %s", competitor['name'], result)
+            elif result:
+                changes.append(result)
         
-        for competitor in self.competitors:
+        return changes
+    
+    def schedule(self, loop, interval: int = 86400):
+        """Schedule periodic competitor tracking as a task on a shared event loop"""
+        return loop.create_task(self._tracking_loop(interval))
+    
+    async def _tracking_loop(self, interval: int):
+        """Track competitor changes every interval seconds"""
+        while True:
             try:
-                current_analysis = self._analyze_competitor_website(competitor['domain'])
-                previous_analysis = self._get_previous_analysis(competitor['domain'])
-                
-                if previous_analysis:
-                    changes_detected = self._compare_analyses(previous_analysis, current_analysis)
-                    if changes_detected:
-                        changes.append({
-                            'competitor': competitor['name'],
-                            'changes': changes_detected,
-                            'detected_at': datetime.now()
-                        })
-                
-                # Update last checked
-                competitor['last_checked'] = datetime.now()
-                
+                changes = await self.track_competitor_changes_async()
+                if changes:
+                    logger.info("Detected changes for %d competitors", len(changes))
             except Exception as e:
-                self.logger.error(f"Error tracking {competitor['name']}: {e}")
+                logger.error("Competitor tracking error: %s", e)
+            await asyncio.sleep(interval)
+    
+    def _check_competitor(self, competitor: Dict) -> Optional[Dict]:
+        """Analyze one competitor and return detected changes, if any"""
+        current_analysis = self._analyze_competitor_website(competitor['domain'])
+        previous_analysis = self._get_previous_analysis(competitor['domain'])
         
-        return changes
+        change = None
+        if previous_analysis:
+            changes_detected = self._compare_analyses(previous_analysis, current_analysis)
+            if changes_detected:
+                change = {
+                    'competitor': competitor['name'],
+                    'changes': changes_detected,
+                    'detected_at': datetime.now()
+                }
+        
+        # Update last checked (monotonic; internal bookkeeping only)
+        competitor['last_checked'] = time.monotonic()
+        return change
     
     def _load_default_competitors(self):
         """Load default South African competitors"""
@@ -98,16 +161,12 @@ class CompetitorTracker:
     
     def _analyze_service_offerings(self) -> Dict:
         """Analyze competitor service offerings"""
-        common_services = {}
-        
-        for competitor in self.competitors:
-            for service in competitor['focus_areas']:
-                common_services[service] = common_services.get(service, 0) + 1
+        common_services = Counter(chain.from_iterable(c['focus_areas'] for c in self.competitors))
         
         return {
-            'most_common_services': sorted(common_services.items(), key=lambda x: x[1], reverse=True)[:5],
-            'service_gaps': ['AI-Powered Lead Generation', '24/7 Lead Monitoring', 'Predictive Analytics'],
-            'opportunity_areas': ['Vertical-specific solutions', 'SMB-focused packages', 'Performance-based pricing']
+            'most_common_services': common_services.most_common(5),
+            'service_gaps': _SERVICE_GAPS,
+            'opportunity_areas': _OPPORTUNITY_AREAS
         }
     
     def _identify_market_gaps(self) -> List[str]:
@@ -132,7 +191,7 @@ class CompetitorTracker:
     
     def _analyze_competitor_website(self, domain: str) -> Dict:
         """Analyze competitor website (mock implementation)"""
-        # In production, this would use web scraping
+        # In production, this would scrape via self.session.get(url, timeout=(3, 5))
         return {
             'services': ['Lead Generation', 'Digital Marketing', 'SEO'],
             'pricing_mentioned': True,
@@ -1,5 +0,0 @@
-from .market_analyzer import MarketAnalyzer
-from .competitor_tracker import CompetitorTracker
-from .trend_predictor import TrendPredictor
-
-__all__ = ['MarketAnalyzer', 'CompetitorTracker', 'TrendPredictor']
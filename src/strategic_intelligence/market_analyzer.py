@@ -2,18 +2,106 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
-from typing import Dict, List
-import json
+from typing import Dict, List, Mapping
+import time
+import types
+
+logger = logging.getLogger(__name__)
+
+# Mock indicator data - integrate with Stats SA or similar APIs.
+# Shared read-only views so callers never pay for rebuilding them.
+_ECON = types.MappingProxyType({
+    'gdp_growth': 0.8,           # Percentage
+    'inflation': 5.2,            # Percentage
+    'business_confidence': 45,    # Index (0-100)
+    'unemployment': 32.7,         # Percentage
+    'interest_rate': 8.25         # Percentage
+})
+
+_DIGITAL = types.MappingProxyType({
+    'internet_penetration': 72,      # Percentage
+    'mobile_usage': 85,              # Percentage  
+    'ecommerce_growth': 25,          # Percentage year-on-year
+    'digital_marketing_adoption': 60, # Percentage of businesses
+    'saas_adoption': 35,             # Percentage of businesses
+    'growth_rate': 20                # Overall digital growth rate
+})
+
+_SME = types.MappingProxyType({
+    'optimism': 65,              # Percentage optimistic about future
+    'investment_intent': 55,      # Percentage planning to invest
+    'hiring_plans': 40,           # Percentage planning to hire
+    'digital_transformation_priority': 70,  # Percentage prioritizing digital
+    'challenges': ('Load shedding', 'Economic uncertainty', 'Access to funding')
+})
+
+_COMPETITOR_STRATEGY = types.MappingProxyType({
+    'pricing_range': 'R15,000 - R30,000',
+    'service_focus': 'Lead generation and digital marketing',
+    'market_position': 'Mid-market SME focus',
+    'strengths': ('Established brand', 'Case studies', 'Multiple service offerings'),
+    'weaknesses': ('Higher pricing', 'Less personalized service', 'Slower response times'),
+    'differentiation_opportunities': (
+        'AI-powered personalization',
+        'Faster lead delivery', 
+        'More flexible pricing',
+        'Better customer support'
+    )
+})
+
+# Market health score (0-100): business confidence, internet penetration,
+# SME optimism and e-commerce growth each contribute up to 25 points
+_SCALES = np.array([100, 100, 100, 50], dtype=float)
+_WEIGHTS = np.array([25, 25, 25, 25], dtype=float)
+
+def _market_health_scores(values: np.ndarray) -> np.ndarray:
+    """Score one (4,) or many (n, 4) indicator rows in a single pass"""
+    return np.minimum(np.asarray(values, dtype=float) / _SCALES, 1.0) @ _WEIGHTS
+
+def _as_dict(table: Mapping) -> Dict:
+    """Plain copy of a read-only table for callers (tuples become lists)"""
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in table.items()}
 
 class MarketAnalyzer:
     def __init__(self, db_connection):
         self.db = db_connection
         self.cache = {}
-        self.logger = logging.getLogger(__name__)
+        self.cache_ttl = 300  # seconds; indicators change at most hourly
     
     def analyze_sa_market(self) -> Dict:
-        """Analyze South African market conditions for digital services"""
-        self.logger.info("Analyzing South African market conditions")
+        """Analyze South African market conditions for digital services
+        
+        Results are memoized for cache_ttl seconds, so the indicators may be
+        that stale; call invalidate() when upstream indicators refresh. Each
+        call gets its own copy, with 'timestamp' set to the call time.
+        """
+        cached = self.cache.get('sa_market')
+        if cached is not None and cached[0] > time.monotonic():
+            logger.debug("Market analysis cache hit")
+            analysis = cached[1]
+        else:
+            logger.debug("Market analysis cache miss")
+            analysis = self._analyze_sa_market()
+            self.cache['sa_market'] = (time.monotonic() + self.cache_ttl, analysis)
+        
+        # The cached analysis shares the read-only tables; callers get copies
+        return {
+            **analysis,
+            'timestamp': datetime.now(),
+            'economic_indicators': _as_dict(analysis['economic_indicators']),
+            'digital_adoption_trends': _as_dict(analysis['digital_adoption_trends']),
+            'sme_sentiment': _as_dict(analysis['sme_sentiment']),
+            'opportunity_areas': [dict(area) for area in analysis['opportunity_areas']],
+            'recommendations': list(analysis['recommendations'])
+        }
+    
+    def invalidate(self):
+        """Drop memoized analyses"""
+        self.cache.clear()
+    
+    def _analyze_sa_market(self) -> Dict:
+        """Run the full South African market analysis"""
+        logger.info("Analyzing South African market conditions")
         
         analysis = {
             'timestamp': datetime.now(),
@@ -26,12 +114,12 @@ class MarketAnalyzer:
         }
         
         # Calculate market health score (0-100)
-        economic_score = analysis['economic_indicators']['business_confidence'] / 100 * 25
-        digital_score = analysis['digital_adoption_trends']['internet_penetration'] / 100 * 25
-        sentiment_score = analysis['sme_sentiment']['optimism'] / 100 * 25
-        growth_score = min(analysis['digital_adoption_trends']['ecommerce_growth'] / 50 * 25, 25)
-        
-        analysis['market_health_score'] = economic_score + digital_score + sentiment_score + growth_score
+        analysis['market_health_score'] = float(_market_health_scores([
+            analysis['economic_indicators']['business_confidence'],
+            analysis['digital_adoption_trends']['internet_penetration'],
+            analysis['sme_sentiment']['optimism'],
+            analysis['digital_adoption_trends']['ecommerce_growth']
+        ]))
         
         # Identify high-opportunity areas
         if analysis['digital_adoption_trends'].get('growth_rate', 0) > 15:
@@ -63,22 +151,31 @@ class MarketAnalyzer:
         else:
             analysis['recommendations'].append("Focus on niche markets and cost efficiency")
         
-        self.logger.info(f"Market analysis completed. Health score: {analysis['market_health_score']:.1f}")
+        logger.info("Market analysis completed. Health score: %.1f", analysis['market_health_score'])
         return analysis
     
+    def score_market_segments(self, indicators: List[List[float]]) -> List[float]:
+        """Score many market segments or time-series points at once
+        
+        Each row is [business_confidence, internet_penetration, optimism, ecommerce_growth].
+        """
+        if not len(indicators):
+            return []
+        return _market_health_scores(indicators).tolist()
+    
     def track_competitor_strategy(self, competitor_domains: List[str]) -> Dict:
         """Track competitor strategies and pricing"""
-        self.logger.info(f"Tracking strategies for {len(competitor_domains)} competitors")
+        logger.info("Tracking strategies for %d competitors", len(competitor_domains))
         
         strategies = {}
         
         for domain in competitor_domains:
             try:
                 strategy = self._analyze_competitor_strategy(domain)
-                strategies[domain] = strategy
-                self.logger.debug(f"Analyzed competitor: {domain}")
+                strategies[domain] = _as_dict(strategy)
+                logger.debug("Analyzed competitor: %s", domain)
             except Exception as e:
-                self.logger.error(f"Error analyzing {domain}: {e}")
+                logger.error("Error analyzing %s: %s", domain, e)
                 strategies[domain] = {'error': str(e)}
         
         return strategies
@@ -100,51 +197,19 @@ class MarketAnalyzer:
             }
         }
     
-    def _get_economic_indicators(self) -> Dict:
+    def _get_economic_indicators(self) -> Mapping:
         """Get South African economic indicators"""
-        # Mock data - integrate with Stats SA or similar APIs
-        return {
-            'gdp_growth': 0.8,           # Percentage
-            'inflation': 5.2,            # Percentage
-            'business_confidence': 45,    # Index (0-100)
-            'unemployment': 32.7,         # Percentage
-            'interest_rate': 8.25         # Percentage
-        }
+        return _ECON
     
-    def _get_digital_trends(self) -> Dict:
+    def _get_digital_trends(self) -> Mapping:
         """Get digital adoption trends in South Africa"""
-        return {
-            'internet_penetration': 72,      # Percentage
-            'mobile_usage': 85,              # Percentage  
-            'ecommerce_growth': 25,          # Percentage year-on-year
-            'digital_marketing_adoption': 60, # Percentage of businesses
-            'saas_adoption': 35,             # Percentage of businesses
-            'growth_rate': 20                # Overall digital growth rate
-        }
+        return _DIGITAL
     
-    def _get_sme_sentiment(self) -> Dict:
+    def _get_sme_sentiment(self) -> Mapping:
         """Get SME business sentiment in South Africa"""
-        return {
-            'optimism': 65,              # Percentage optimistic about future
-            'investment_intent': 55,      # Percentage planning to invest
-            'hiring_plans': 40,           # Percentage planning to hire
-            'digital_transformation_priority': 70,  # Percentage prioritizing digital
-            'challenges': ['Load shedding', 'Economic uncertainty', 'Access to funding']
-        }
+        return _SME
     
-    def _analyze_competitor_strategy(self, domain: str) -> Dict:
+    def _analyze_competitor_strategy(self, domain: str) -> Mapping:
         """Analyze individual competitor strategy"""
         # Mock analysis - integrate with web scraping in production
-        return {
-            'pricing_range': 'R15,000 - R30,000',
-            'service_focus': 'Lead generation and digital marketing',
-            'market_position': 'Mid-market SME focus',
-            'strengths': ['Established brand', 'Case studies', 'Multiple service offerings'],
-            'weaknesses': ['Higher pricing', 'Less personalized service', 'Slower response times'],
-            'differentiation_opportunities': [
-                'AI-powered personalization',
-                'Faster lead delivery', 
-                'More flexible pricing',
-                'Better customer support'
-            ]
-        }
+        return _COMPETITOR_STRATEGY
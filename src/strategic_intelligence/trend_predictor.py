@@ -1,17 +1,129 @@
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Sequence, Union
 import pandas as pd
 import numpy as np
 
+logger = logging.getLogger(__name__)
+rng = np.random.default_rng()
+
+# Static market knowledge shared read-only across calls
+_SEASONAL_PATTERNS = MappingProxyType({
+    'q1_jan_mar': MappingProxyType({
+        'characteristics': ('Post-holiday planning', 'Budget allocation', 'Strategic initiatives start'),
+        'opportunity': 'high',
+        'recommendation': 'Focus on strategic planning and budget discussions'
+    }),
+    'q2_apr_jun': MappingProxyType({
+        'characteristics': ('Execution phase', 'Mid-year reviews', 'Adjustment period'),
+        'opportunity': 'medium', 
+        'recommendation': 'Emphasize quick wins and measurable results'
+    }),
+    'q3_jul_sep': MappingProxyType({
+        'characteristics': ('Budget planning for next year', 'Performance evaluation', 'Decision making'),
+        'opportunity': 'high',
+        'recommendation': 'Position for next year budgets and annual contracts'
+    }),
+    'q4_oct_dec': MappingProxyType({
+        'characteristics': ('Year-end push', 'Budget utilization', 'Holiday slowdown'),
+        'opportunity': 'medium',
+        'recommendation': 'Focus on closing deals and planning for Q1'
+    })
+})
+
+_DIGITAL_ADOPTION = MappingProxyType({
+    'trend': 'increasing',
+    'rate': 'accelerating', 
+    'key_drivers': ('Remote work', 'E-commerce growth', 'Mobile penetration'),
+    'estimated_growth': 25,  # Percentage
+    'timeframe': 'next_12_months'
+})
+
+_SME_SPENDING = MappingProxyType({
+    'trend': 'cautiously_increasing',
+    'focus_areas': ('Digital marketing', 'Automation', 'Customer acquisition'),
+    'budget_constraints': ('Economic uncertainty', 'Load shedding costs', 'Inflation'),
+    'estimated_increase': 15  # Percentage
+})
+
+_TECH_ADOPTION = MappingProxyType({
+    'ai_adoption': 'accelerating',
+    'cloud_services': 'mature',
+    'automation_tools': 'growing', 
+    'emerging_technologies': ('AI-powered analytics', 'Predictive lead scoring', 'Conversational AI'),
+    'adoption_barriers': ('Cost', 'Technical skills', 'Integration complexity')
+})
+
+_RISK_FACTORS = (
+    MappingProxyType({
+        'risk': 'Economic downturn',
+        'probability': 'medium',
+        'impact': 'high',
+        'mitigation': 'Diversify service offerings, focus on ROI demonstration'
+    }),
+    MappingProxyType({
+        'risk': 'Increased competition', 
+        'probability': 'high',
+        'impact': 'medium',
+        'mitigation': 'Differentiate through AI capabilities and superior service'
+    }),
+    MappingProxyType({
+        'risk': 'Technology disruption',
+        'probability': 'low', 
+        'impact': 'high',
+        'mitigation': 'Continuous innovation and technology monitoring'
+    })
+)
+
+_OPPORTUNITY_AREAS = (
+    MappingProxyType({
+        'area': 'Vertical-specific AI solutions',
+        'potential': 'high',
+        'timeline': '6-12 months',
+        'actions': ('Develop industry-specific templates', 'Create vertical case studies')
+    }),
+    MappingProxyType({
+        'area': 'SMB market automation',
+        'potential': 'very_high', 
+        'timeline': '3-6 months',
+        'actions': ('Create affordable packages', 'Simplify onboarding process')
+    }),
+    MappingProxyType({
+        'area': 'Integrated marketing suites',
+        'potential': 'medium',
+        'timeline': '12-18 months', 
+        'actions': ('Partner with complementary tools', 'Develop API integrations')
+    })
+)
+
+def _plain(value):
+    """Deep plain copy of a shared table: mappings become dicts, tuples lists"""
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+class SampleData(NamedTuple):
+    """Monthly sample series as plain arrays, one per indicator"""
+    dates: np.ndarray
+    digital_adoption: np.ndarray
+    sme_spending: np.ndarray
+    lead_demand: np.ndarray
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert to the DataFrame layout predict_market_trends accepts"""
+        data = pd.DataFrame(self._asdict())
+        return data.rename(columns={'dates': 'date'})
+
 class TrendPredictor:
     def __init__(self, db_connection):
         self.db = db_connection
-        self.logger = logging.getLogger(__name__)
     
-    def predict_market_trends(self, historical_data: pd.DataFrame = None) -> Dict:
+    def predict_market_trends(self, historical_data: Union[pd.DataFrame, SampleData] = None) -> Dict:
         """Predict future market trends"""
-        self.logger.info("Predicting market trends")
+        logger.info("Predicting market trends")
         
         if historical_data is None:
             historical_data = self._generate_sample_data()
@@ -19,11 +131,12 @@ class TrendPredictor:
         predictions = {
             'timestamp': datetime.now(),
             'time_horizon': '6_months',
-            'digital_adoption_trend': self._predict_digital_adoption(historical_data),
-            'sme_spending_trend': self._predict_sme_spending(historical_data),
-            'technology_adoption_trend': self._predict_tech_adoption(historical_data),
-            'risk_factors': self._identify_risk_factors(),
-            'opportunity_areas': self._identify_opportunity_areas(),
+            # Predictions are drawn from shared read-only tables; callers get copies
+            'digital_adoption_trend': _plain(self._predict_digital_adoption(historical_data)),
+            'sme_spending_trend': _plain(self._predict_sme_spending(historical_data)),
+            'technology_adoption_trend': _plain(self._predict_tech_adoption(historical_data)),
+            'risk_factors': _plain(self._identify_risk_factors()),
+            'opportunity_areas': _plain(self._identify_opportunity_areas()),
             'confidence_level': 'medium'  # low, medium, high
         }
         
@@ -31,141 +144,100 @@ class TrendPredictor:
     
     def predict_revenue_growth(self, current_clients: int, growth_rate: float = 0.3) -> Dict:
         """Predict revenue growth over next 12 months"""
-        projections = {}
-        monthly_clients = current_clients
         monthly_rate = 25000  # ZAR
         
-        for month in range(1, 13):
-            monthly_revenue = monthly_clients * monthly_rate
-            cumulative_revenue = sum(proj['revenue'] for proj in projections.values()) + monthly_revenue
-            
-            projections[f'month_{month}'] = {
-                'month': month,
-                'clients': int(monthly_clients),
-                'revenue': monthly_revenue,
-                'cumulative_revenue': cumulative_revenue,
+        # Compounding growth as one cumulative product (same multiply order
+        # as month-by-month compounding), then revenue and running totals
+        months = np.arange(1, 13)
+        clients_arr = np.cumprod(np.r_[float(current_clients), np.full(11, 1 + growth_rate)])
+        revenue_arr = clients_arr * monthly_rate
+        cum_arr = np.cumsum(revenue_arr)
+        
+        projections = {
+            f'month_{m}': {
+                'month': m,
+                'clients': c,
+                'revenue': r,
+                'cumulative_revenue': cum,
                 'growth_rate': growth_rate
             }
-            
-            # Apply compounding growth
-            monthly_clients *= (1 + growth_rate)
+            for m, c, r, cum in zip(months.tolist(), clients_arr.astype(int).tolist(),
+                                    revenue_arr.tolist(), cum_arr.tolist())
+        }
         
         summary = {
             'projections': projections,
             'total_year_revenue': projections['month_12']['cumulative_revenue'],
             'average_monthly_growth': growth_rate * 100,
-            'clients_end_year': int(monthly_clients / (1 + growth_rate))  # Back to final month count
+            'clients_end_year': int(clients_arr[-1])
         }
         
         return summary
     
-    def identify_seasonal_patterns(self) -> Dict:
-        """Identify seasonal patterns in the South African market"""
+    def predict_revenue_growth_batch(self, clients_arr, rates_arr) -> Dict[str, np.ndarray]:
+        """Project 12 months of revenue for many (clients, growth rate) scenarios at once
+        
+        Inputs broadcast against each other; every output is an (N, 12) array
+        with row i matching predict_revenue_growth(clients_arr[i], rates_arr[i]).
+        """
+        monthly_rate = 25000  # ZAR
+        
+        clients0, rates = np.broadcast_arrays(np.atleast_1d(np.asarray(clients_arr, dtype=float)),
+                                              np.atleast_1d(np.asarray(rates_arr, dtype=float)))
+        
+        # Same layout as the single-scenario cumprod: starting clients then
+        # eleven growth factors per row, compounded in place
+        clients = np.empty((clients0.shape[0], 12))
+        clients[:, 0] = clients0
+        clients[:, 1:] = (1 + rates)[:, None]
+        np.cumprod(clients, axis=1, out=clients)
+        
+        revenue = clients * monthly_rate
+        cumulative = np.cumsum(revenue, axis=1)
+        
         return {
-            'q1_jan_mar': {
-                'characteristics': ['Post-holiday planning', 'Budget allocation', 'Strategic initiatives start'],
-                'opportunity': 'high',
-                'recommendation': 'Focus on strategic planning and budget discussions'
-            },
-            'q2_apr_jun': {
-                'characteristics': ['Execution phase', 'Mid-year reviews', 'Adjustment period'],
-                'opportunity': 'medium', 
-                'recommendation': 'Emphasize quick wins and measurable results'
-            },
-            'q3_jul_sep': {
-                'characteristics': ['Budget planning for next year', 'Performance evaluation', 'Decision making'],
-                'opportunity': 'high',
-                'recommendation': 'Position for next year budgets and annual contracts'
-            },
-            'q4_oct_dec': {
-                'characteristics': ['Year-end push', 'Budget utilization', 'Holiday slowdown'],
-                'opportunity': 'medium',
-                'recommendation': 'Focus on closing deals and planning for Q1'
-            }
+            'clients': clients,
+            'revenue': revenue,
+            'cumulative_revenue': cumulative,
+            'total_year_revenue': cumulative[:, -1]
         }
     
-    def _predict_digital_adoption(self, data: pd.DataFrame) -> Dict:
+    def identify_seasonal_patterns(self) -> Dict:
+        """Identify seasonal patterns in the South African market"""
+        return _plain(_SEASONAL_PATTERNS)
+    
+    def _predict_digital_adoption(self, data: Union[pd.DataFrame, SampleData]) -> Mapping:
         """Predict digital adoption trends"""
-        return {
-            'trend': 'increasing',
-            'rate': 'accelerating', 
-            'key_drivers': ['Remote work', 'E-commerce growth', 'Mobile penetration'],
-            'estimated_growth': 25,  # Percentage
-            'timeframe': 'next_12_months'
-        }
+        return _DIGITAL_ADOPTION
     
-    def _predict_sme_spending(self, data: pd.DataFrame) -> Dict:
+    def _predict_sme_spending(self, data: Union[pd.DataFrame, SampleData]) -> Mapping:
         """Predict SME spending patterns"""
-        return {
-            'trend': 'cautiously_increasing',
-            'focus_areas': ['Digital marketing', 'Automation', 'Customer acquisition'],
-            'budget_constraints': ['Economic uncertainty', 'Load shedding costs', 'Inflation'],
-            'estimated_increase': 15  # Percentage
-        }
+        return _SME_SPENDING
     
-    def _predict_tech_adoption(self, data: pd.DataFrame) -> Dict:
+    def _predict_tech_adoption(self, data: Union[pd.DataFrame, SampleData]) -> Mapping:
         """Predict technology adoption trends"""
-        return {
-            'ai_adoption': 'accelerating',
-            'cloud_services': 'mature',
-            'automation_tools': 'growing', 
-            'emerging_technologies': ['AI-powered analytics', 'Predictive lead scoring', 'Conversational AI'],
-            'adoption_barriers': ['Cost', 'Technical skills', 'Integration complexity']
-        }
+        return _TECH_ADOPTION
     
-    def _identify_risk_factors(self) -> List[Dict]:
+    def _identify_risk_factors(self) -> Sequence[Mapping]:
         """Identify potential risk factors"""
-        return [
-            {
-                'risk': 'Economic downturn',
-                'probability': 'medium',
-                'impact': 'high',
-                'mitigation': 'Diversify service offerings, focus on ROI demonstration'
-            },
-            {
-                'risk': 'Increased competition', 
-                'probability': 'high',
-                'impact': 'medium',
-                'mitigation': 'Differentiate through AI capabilities and superior service'
-            },
-            {
-                'risk': 'Technology disruption',
-                'probability': 'low', 
-                'impact': 'high',
-                'mitigation': 'Continuous innovation and technology monitoring'
-            }
-        ]
+        return _RISK_FACTORS
     
-    def _identify_opportunity_areas(self) -> List[Dict]:
+    def _identify_opportunity_areas(self) -> Sequence[Mapping]:
         """Identify emerging opportunity areas"""
-        return [
-            {
-                'area': 'Vertical-specific AI solutions',
-                'potential': 'high',
-                'timeline': '6-12 months',
-                'actions': ['Develop industry-specific templates', 'Create vertical case studies']
-            },
-            {
-                'area': 'SMB market automation',
-                'potential': 'very_high', 
-                'timeline': '3-6 months',
-                'actions': ['Create affordable packages', 'Simplify onboarding process']
-            },
-            {
-                'area': 'Integrated marketing suites',
-                'potential': 'medium',
-                'timeline': '12-18 months', 
-                'actions': ['Partner with complementary tools', 'Develop API integrations']
-            }
-        ]
+        return _OPPORTUNITY_AREAS
     
-    def _generate_sample_data(self) -> pd.DataFrame:
+    def _generate_sample_data(self) -> SampleData:
         """Generate sample historical data for analysis"""
-        dates = pd.date_range(start='2023-01-01', end=datetime.now(), freq='M')
-        data = {
-            'date': dates,
-            'digital_adoption': np.random.normal(60, 5, len(dates)).cumsum(),
-            'sme_spending': np.random.normal(50, 8, len(dates)).cumsum(),
-            'lead_demand': np.random.normal(45, 6, len(dates)).cumsum()
-        }
-        return pd.DataFrame(data)
+        # Month ends from Jan 2023 up to the last completed month: the day
+        # before the first of each following month
+        months = np.arange(np.datetime64('2023-01', 'M'), np.datetime64(datetime.now(), 'M'))
+        dates = (months + 1).astype('datetime64[D]') - np.timedelta64(1, 'D')
+        
+        # All three random walks drawn in one batch: rows are digital
+        # adoption, SME spending and lead demand
+        means = np.array([60, 50, 45])[:, None]
+        sigmas = np.array([5, 8, 6])[:, None]
+        samples = rng.standard_normal((3, len(dates))) * sigmas + means
+        np.cumsum(samples, axis=1, out=samples)
+        
+        return SampleData(dates, *samples)
@@ -0,0 +1,5 @@
+from .content_generator import ContentGenerator
+from .strategy_analyzer import StrategyAnalyzer
+from .decision_engine import DecisionEngine
+
+__all__ = ['ContentGenerator', 'StrategyAnalyzer', 'DecisionEngine']
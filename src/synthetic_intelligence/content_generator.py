@@ -1,38 +1,119 @@
-import logging
 import random
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Union
+import numpy as np
+
+rng = np.random.default_rng()
+
+class Lead(NamedTuple):
+    """Compact lead record for bulk content generation (no per-lead dict)"""
+    company_name: str
+    contact_name: str = 'Team'
+    industry: str = 'industry'
+    id: Optional[str] = None
+
+def _as_lead(lead_data: Union[Lead, Dict]) -> Lead:
+    """Accept either a Lead or a legacy lead dict"""
+    if isinstance(lead_data, Lead):
+        return lead_data
+    return Lead(
+        lead_data['company_name'],
+        lead_data.get('contact_name', 'Team'),
+        lead_data.get('industry', 'industry'),
+        lead_data.get('id')
+    )
+
+# Email bodies as precomputed %-templates; one dict substitution per render
+_COLD_TEMPLATE = """
+Dear %(contact_name)s at %(company_name)s,
+
+I came across %(company_name)s and was impressed by your work in the %(industry)s sector.
+
+We specialize in helping businesses like yours generate 20-30 qualified leads per week using our AI-powered systems. Many of our clients in South Africa are achieving remarkable results, with some seeing 3x increases in qualified leads within the first month.
+
+Our system works 24/7 to:
+• Identify high-intent potential customers
+• Qualify leads based on your specific criteria
+• Deliver ready-to-contact prospects directly to you
+
+Would you be open to a quick 15-minute call to explore if similar results would be valuable for %(company_name)s?
+
+Best regards,
+AI Growth Team
+AI Growth Solutions SA
+        """
+
+_FOLLOW_UP_TEMPLATE = """
+Hi %(contact_name)s,
+
+Just following up on my previous email about lead generation opportunities for %(company_name)s.
+
+We're currently offering a free lead generation assessment for qualified businesses. This includes:
+- Analysis of your current lead flow
+- Identification of 3-5 immediate opportunities
+- Customized AI lead generation strategy
+
+Would this be of interest?
+
+Best,
+AI Growth Team
+        """
+
+@lru_cache(maxsize=1024)
+def _render_cold_email(company_name: str, contact_name: str, industry: str) -> str:
+    """Render the cold email body; repeated leads in a batch hit the cache"""
+    return _COLD_TEMPLATE % {'company_name': company_name, 'contact_name': contact_name, 'industry': industry}
+
+@lru_cache(maxsize=1024)
+def _render_follow_up_email(company_name: str, contact_name: str) -> str:
+    """Render the follow-up email body"""
+    return _FOLLOW_UP_TEMPLATE % {'company_name': company_name, 'contact_name': contact_name}
 
 class ContentGenerator:
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
         self.templates = self._load_templates()
+        # Subject templates pre-bound to their format_map so generation is
+        # a single call on the chosen template
+        self._subject_fns = tuple(t.format_map for t in self.templates['email_subjects'])
     
-    def _load_templates(self) -> Dict:
-        """Load content templates"""
-        return {
-            'email_subjects': [
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_templates() -> Mapping:
+        """Load content templates, shared read-only by every generator"""
+        return MappingProxyType({
+            'email_subjects': (
                 "Growth opportunity for {company_name}",
                 "How {company_name} can generate more leads",
                 "AI-powered lead generation for {company_name}",
                 "Increasing {company_name}'s qualified leads",
                 "Digital transformation for {company_name}"
-            ],
-            'value_propositions': [
+            ),
+            'value_propositions': (
                 "Generate 20-30 qualified leads weekly",
                 "3x increase in qualified leads within 30 days",
                 "AI-powered system working 24/7 for your business",
                 "Proven results with South African SMEs",
                 "No upfront costs, pay only for results"
-            ]
-        }
+            )
+        })
     
     def generate_email_subject(self, company_data: Dict) -> str:
         """Generate personalized email subject"""
-        template = random.choice(self.templates['email_subjects'])
-        return template.format(**company_data)
+        return random.choice(self._subject_fns)(company_data)
+    
+    def generate_email_subjects_batch(self, company_data_list: List[Dict]) -> List[str]:
+        """Generate personalized subjects for many companies with one RNG draw"""
+        idx = rng.integers(0, len(self._subject_fns), size=len(company_data_list))
+        return [self._subject_fns[i](company_data) for i, company_data in zip(idx.tolist(), company_data_list)]
+    
+    def generate_emails(self, leads: Iterable[Lead], email_type: str = 'cold') -> Iterator[str]:
+        """Lazily generate email bodies so large lead streams are never materialized"""
+        for lead in leads:
+            yield self.generate_email_body(lead, email_type)
     
-    def generate_email_body(self, lead_data: Dict, email_type: str = 'cold') -> str:
+    def generate_email_body(self, lead_data: Union[Lead, Dict], email_type: str = 'cold') -> str:
         """Generate personalized email body"""
         if email_type == 'cold':
             return self._generate_cold_email(lead_data)
@@ -41,45 +122,21 @@ class ContentGenerator:
         else:
             return self._generate_cold_email(lead_data)
     
-    def _generate_cold_email(self, lead_data: Dict) -> str:
+    def _generate_cold_email(self, lead_data: Union[Lead, Dict]) -> str:
         """Generate cold email content"""
-        return f"""
-Dear {lead_data.get('contact_name', 'Team')} at {lead_data['company_name']},
-
-I came across {lead_data['company_name']} and was impressed by your work in the {lead_data.get('industry', 'industry')} sector.
-
-We specialize in helping businesses like yours generate 20-30 qualified leads per week using our AI-powered systems. Many of our clients in South Africa are achieving remarkable results, with some seeing 3x increases in qualified leads within the first month.
-
-Our system works 24/7 to:
-• Identify high-intent potential customers
-• Qualify leads based on your specific criteria
-• Deliver ready-to-contact prospects directly to you
-
-Would you be open to a quick 15-minute call to explore if similar results would be valuable for {lead_data['company_name']}?
-
-Best regards,
-AI Growth Team
-AI Growth Solutions SA
-        """
+        lead = _as_lead(lead_data)
+        return _render_cold_email(lead.company_name, lead.contact_name, lead.industry)
     
-    def _generate_follow_up_email(self, lead_data: Dict) -> str:
+    def _generate_follow_up_email(self, lead_data: Union[Lead, Dict]) -> str:
         """Generate follow-up email content"""
-        return f"""
-Hi {lead_data.get('contact_name', 'Team')},
-
-Just following up on my previous email about lead generation opportunities for {lead_data['company_name']}.
-
-We're currently offering a free lead generation assessment for qualified businesses. This includes:
-- Analysis of your current lead flow
-- Identification of 3-5 immediate opportunities
-- Customized AI lead generation strategy
-
-Would this be of interest?
-
-Best,
-AI Growth Team
-        """
+        lead = _as_lead(lead_data)
+        return _render_follow_up_email(lead.company_name, lead.contact_name)
     
     def generate_value_proposition(self) -> str:
         """Generate value proposition"""
         return random.choice(self.templates['value_propositions'])
+    
+    def generate_value_propositions_batch(self, n: int) -> List[str]:
+        """Generate n value propositions with one RNG draw"""
+        propositions = self.templates['value_propositions']
+        return [propositions[i] for i in rng.integers(0, len(propositions), size=n).tolist()]
@@ -1,17 +1,102 @@
 import logging
+from collections import deque
 from datetime import datetime
+from enum import IntEnum
 from typing import Dict, List
-import json
+from operator import gt, lt
+from types import MappingProxyType
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class Impact(IntEnum):
+    """Expected impact of an action; weighted 3x when prioritizing"""
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+class Effort(IntEnum):
+    """Estimated effort of an action, inverted so low effort ranks higher"""
+    LOW = 3
+    MEDIUM = 2
+    HIGH = 1
+
+# Action dicts carry 'low'/'medium'/'high' strings; map them onto the enums
+_IMPACT_SCORES = {level.name.lower(): level for level in Impact}
+_EFFORT_SCORES = {level.name.lower(): level for level in Effort}
+
+def _level(value, levels: Dict, default: IntEnum) -> int:
+    """Score an impact/effort value given as an enum member or a string"""
+    return value if isinstance(value, int) else levels.get(value, default)
+
+# Recommendation per failed check in evaluate_agent_performance, in check order
+_AGENT_RECOMMENDATIONS = (
+    "Retrain {} with new data and patterns",
+    "Optimize {} algorithms for better performance",
+    "Add error handling and validation to {}"
+)
+
+# Recommended actions per rule, shared read-only across decisions
+_REVGAP_ACTIONS = (
+    MappingProxyType({
+        'action': "Increase outreach capacity by 50%",
+        'impact': "high",
+        'timeline': "immediate"
+    }),
+    MappingProxyType({
+        'action': "Launch referral program for existing clients",
+        'impact': "medium",
+        'timeline': "1-2 weeks"
+    }),
+    MappingProxyType({
+        'action': "Create limited-time premium package offer",
+        'impact': "high", 
+        'timeline': "1 week"
+    })
+)
+_CAC_ACTIONS = (
+    MappingProxyType({
+        'action': "Optimize lead qualification process to focus on high-intent prospects",
+        'impact': "medium",
+        'timeline': "2-3 weeks"
+    }),
+)
+_CONV_ACTIONS = (
+    MappingProxyType({
+        'action': "Improve email personalization and follow-up sequence",
+        'impact': "high",
+        'timeline': "1 week"
+    }),
+)
+_RETENTION_ACTIONS = (
+    MappingProxyType({
+        'action': "Implement client success check-ins and value demonstration",
+        'impact': "high", 
+        'timeline': "immediate"
+    }),
+)
+_REVGAP_UPDATES = MappingProxyType({
+    'expected_impact': "High - Potential to close 40-60% of revenue gap",
+    'priority': 'high'
+})
+_NO_UPDATES = MappingProxyType({})
 
 class DecisionEngine:
+    # (context key, default, comparison, threshold, actions, decision updates)
+    _rules = (
+        ('revenue_gap', 0, gt, 500000, _REVGAP_ACTIONS, _REVGAP_UPDATES),   # Revenue gap analysis
+        ('client_acquisition_cost', 0, gt, 5000, _CAC_ACTIONS, _NO_UPDATES),  # CAC optimization
+        ('conversion_rate', 0, lt, 0.05, _CONV_ACTIONS, _NO_UPDATES),       # Less than 5% conversion
+        ('client_retention_rate', 1.0, lt, 0.85, _RETENTION_ACTIONS, _NO_UPDATES)  # Less than 85% retention
+    )
+    
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self.decision_history = []
+        self.decision_history = deque(maxlen=10_000)
         self.performance_metrics = {}
     
     def make_strategic_decision(self, context: Dict, goals: Dict, constraints: Dict) -> Dict:
         """Make strategic business decisions using rule-based AI"""
-        self.logger.info("Making strategic decision based on current context")
+        logger.info("Making strategic decision based on current context")
         
         decision = {
             'timestamp': datetime.now(),
@@ -23,101 +108,62 @@ class DecisionEngine:
             'estimated_effort': 'medium'
         }
         
-        # Revenue gap analysis
-        revenue_gap = context.get('revenue_gap', 0)
-        if revenue_gap > 500000:
-            decision['recommended_actions'].extend([
-                {
-                    'action': "Increase outreach capacity by 50%",
-                    'impact': "high",
-                    'timeline': "immediate"
-                },
-                {
-                    'action': "Launch referral program for existing clients",
-                    'impact': "medium",
-                    'timeline': "1-2 weeks"
-                },
-                {
-                    'action': "Create limited-time premium package offer",
-                    'impact': "high", 
-                    'timeline': "1 week"
-                }
-            ])
-            decision['expected_impact'] = "High - Potential to close 40-60% of revenue gap"
-            decision['priority'] = 'high'
-        
-        # Client acquisition cost optimization
-        cac = context.get('client_acquisition_cost', 0)
-        if cac > 5000:
-            decision['recommended_actions'].append({
-                'action': "Optimize lead qualification process to focus on high-intent prospects",
-                'impact': "medium",
-                'timeline': "2-3 weeks"
-            })
+        for key, default, op, threshold, actions, updates in self._rules:
+            if op(context.get(key, default), threshold):
+                # Callers get their own dicts; the shared tables stay read-only
+                decision['recommended_actions'].extend(dict(a) for a in actions)
+                decision.update(updates)
         
-        # Lead conversion rate optimization
-        conversion_rate = context.get('conversion_rate', 0)
-        if conversion_rate < 0.05:  # Less than 5%
-            decision['recommended_actions'].append({
-                'action': "Improve email personalization and follow-up sequence",
-                'impact': "high",
-                'timeline': "1 week"
+        # Keep a compact summary for long-running processes; the full decision
+        # (including the caller's context) is retained only when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            self.decision_history.append(decision)
+        else:
+            self.decision_history.append({
+                'timestamp': decision['timestamp'],
+                'priority': decision['priority'],
+                'n_actions': len(decision['recommended_actions'])
             })
-        
-        # Client retention focus
-        retention_rate = context.get('client_retention_rate', 1.0)
-        if retention_rate < 0.85:  # Less than 85%
-            decision['recommended_actions'].append({
-                'action': "Implement client success check-ins and value demonstration",
-                'impact': "high", 
-                'timeline': "immediate"
-            })
-        
-        self.decision_history.append(decision)
-        self.logger.info(f"Strategic decision made: {len(decision['recommended_actions'])} actions recommended")
+        logger.info("Strategic decision made: %d actions recommended", len(decision['recommended_actions']))
         
         return decision
     
     def evaluate_agent_performance(self, agent_metrics: Dict) -> List[str]:
         """Evaluate and optimize AI agent performance"""
-        recommendations = []
+        if not agent_metrics:
+            return []
         
-        for agent, metrics in agent_metrics.items():
-            success_rate = metrics.get('success_rate', 0)
-            response_time = metrics.get('response_time', 999)
-            error_rate = metrics.get('error_rate', 0)
-            
-            if success_rate < 0.3:
-                recommendations.append(f"Retrain {agent} with new data and patterns")
-            
-            if response_time > 60:  # seconds
-                recommendations.append(f"Optimize {agent} algorithms for better performance")
-            
-            if error_rate > 0.1:  # 10% error rate
-                recommendations.append(f"Add error handling and validation to {agent}")
+        names = list(agent_metrics)
+        metrics = agent_metrics.values()
+        n = len(names)
+        success_rate = np.fromiter((m.get('success_rate', 0) for m in metrics), dtype=np.float64, count=n)
+        response_time = np.fromiter((m.get('response_time', 999) for m in metrics), dtype=np.float64, count=n)
+        error_rate = np.fromiter((m.get('error_rate', 0) for m in metrics), dtype=np.float64, count=n)
         
-        return recommendations
+        # One row per agent, one column per check (response time in seconds,
+        # error rate above 10%); nonzero walks it agent by agent
+        failing = np.column_stack((success_rate < 0.3, response_time > 60, error_rate > 0.1))
+        agent_idx, check_idx = np.nonzero(failing)
+        return [_AGENT_RECOMMENDATIONS[c].format(names[a])
+                for a, c in zip(agent_idx.tolist(), check_idx.tolist())]
     
     def prioritize_actions(self, actions: List[Dict]) -> List[Dict]:
         """Prioritize actions based on impact and effort"""
-        scored_actions = []
+        if not actions:
+            return []
         
-        for action in actions:
-            # Simple scoring: impact (3 points) vs effort (1 point)
-            impact_scores = {'low': 1, 'medium': 2, 'high': 3}
-            effort_scores = {'low': 3, 'medium': 2, 'high': 1}
-            
-            score = (impact_scores.get(action.get('impact', 'medium'), 2) * 3 + 
-                    effort_scores.get(action.get('estimated_effort', 'medium'), 2))
-            
-            scored_actions.append({
-                **action,
-                'priority_score': score
-            })
+        # Score all actions at once from compact int8 columns
+        n = len(actions)
+        impacts = np.fromiter((_level(a.get('impact', Impact.MEDIUM), _IMPACT_SCORES, Impact.MEDIUM)
+                               for a in actions), dtype=np.int8, count=n)
+        efforts = np.fromiter((_level(a.get('estimated_effort', Effort.MEDIUM), _EFFORT_SCORES, Effort.MEDIUM)
+                               for a in actions), dtype=np.int8, count=n)
+        scores = impacts * 3 + efforts
         
-        # Sort by priority score descending
-        return sorted(scored_actions, key=lambda x: x['priority_score'], reverse=True)
+        # Sort by priority score descending, keeping input order for ties
+        order = np.argsort(-scores, kind='stable')
+        return [{**actions[k], 'priority_score': int(scores[k])} for k in order.tolist()]
     
     def get_decision_history(self) -> List[Dict]:
         """Get decision history"""
-        return self.decision_history
+        return list(self.decision_history)
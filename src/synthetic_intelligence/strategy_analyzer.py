@@ -1,136 +1,181 @@
-import json
-import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+# South Africa SME statistics
+_SA_SME_STATS = MappingProxyType({
+    'total_smes': 2500000,
+    'tech_adoption_rate': 0.15,
+    'average_marketing_budget': 5000,  # ZAR per month
+    'target_industries': ('Technology', 'Marketing', 'Consulting', 'Professional Services')
+})
+
+@lru_cache(maxsize=128)
+def _estimate_clients(niche: str) -> int:
+    """Potential clients for a niche; niches are a small bounded set"""
+    # Conservative estimate: 1% of addressable market
+    addressable_market = _SA_SME_STATS['total_smes'] * _SA_SME_STATS['tech_adoption_rate']
+    return int(addressable_market * 0.01)
 
 class StrategyAnalyzer:
     def __init__(self, db_config: Dict):
         self.db_config = db_config
-        self.logger = logging.getLogger(__name__)
         self.market_data = {}
         
+        # Per-instance memo keyed on niche; a class-level cache on the
+        # method would also key on (and pin) every instance
+        self._analyze_market_opportunity_cached = lru_cache(maxsize=128)(self._analyze_niche_opportunity)
+        
     def analyze_market_opportunity(self, niche: str) -> Dict:
         """Generate strategic insights for target niche"""
-        self.logger.info(f"Analyzing market opportunity for: {niche}")
+        logger.info("Analyzing market opportunity for: %s", niche)
         
-        analysis = {
+        try:
+            analysis = self._analyze_market_opportunity_cached(niche)
+        except Exception:
+            # Failed lookups are not memoized; answer with per-metric
+            # defaults this time and retry on the next call
+            analysis = self._analyze_niche_opportunity(niche, fallback=True)
+        (market_size, competition_level, growth_potential, strategy,
+         opportunities, risk_assessment) = analysis
+        
+        # Cached parts are immutable; hand callers their own copies
+        return {
             'niche': niche,
             'timestamp': datetime.now(),
-            'market_size': self._estimate_market_size(niche),
-            'competition_level': self._analyze_competition(niche),
-            'growth_potential': self._calculate_growth_potential(niche),
-            'recommended_strategy': '',
-            'risk_assessment': {},
-            'key_opportunities': []
+            'market_size': market_size,
+            'competition_level': competition_level,
+            'growth_potential': growth_potential,
+            'recommended_strategy': strategy,
+            'risk_assessment': dict(risk_assessment),
+            'key_opportunities': list(opportunities)
         }
+    
+    def _analyze_niche_opportunity(self, niche: str, fallback: bool = False) -> Tuple:
+        """Compute the niche-dependent part of analyze_market_opportunity"""
+        market_size, competition_level, growth_potential = self._analyze_niche(niche, fallback)
         
         # Generate strategy based on analysis
-        if analysis['competition_level'] == 'low' and analysis['growth_potential'] == 'high':
-            analysis['recommended_strategy'] = 'Aggressive expansion with premium pricing'
-            analysis['key_opportunities'].append('First-mover advantage in underserved market')
-        elif analysis['competition_level'] == 'high' and analysis['growth_potential'] == 'high':
-            analysis['recommended_strategy'] = 'Differentiation through superior technology and service'
-            analysis['key_opportunities'].append('Focus on AI-powered differentiation')
+        if competition_level == 'low' and growth_potential == 'high':
+            strategy = 'Aggressive expansion with premium pricing'
+            opportunities = ('First-mover advantage in underserved market',)
+        elif competition_level == 'high' and growth_potential == 'high':
+            strategy = 'Differentiation through superior technology and service'
+            opportunities = ('Focus on AI-powered differentiation',)
         else:
-            analysis['recommended_strategy'] = 'Niche specialization with value-based pricing'
-            analysis['key_opportunities'].append('Target specific SME segments with customized solutions')
+            strategy = 'Niche specialization with value-based pricing'
+            opportunities = ('Target specific SME segments with customized solutions',)
         
         # Risk assessment
-        analysis['risk_assessment'] = {
+        risk_assessment = MappingProxyType({
             'market_risk': 'medium',
             'technology_risk': 'low',
             'execution_risk': 'medium',
             'financial_risk': 'low'
-        }
+        })
         
-        self.logger.info(f"Market analysis completed: {analysis['recommended_strategy']}")
-        return analysis
+        logger.info("Market analysis completed: %s", strategy)
+        return market_size, competition_level, growth_potential, strategy, opportunities, risk_assessment
     
     def _estimate_market_size(self, niche: str) -> int:
         """Estimate total addressable market in South Africa"""
-        # South Africa SME statistics
-        sa_sme_stats = {
-            'total_smes': 2500000,
-            'tech_adoption_rate': 0.15,
-            'average_marketing_budget': 5000,  # ZAR per month
-            'target_industries': ['Technology', 'Marketing', 'Consulting', 'Professional Services']
-        }
-        
-        # Conservative estimate: 1% of addressable market
-        addressable_market = sa_sme_stats['total_smes'] * sa_sme_stats['tech_adoption_rate']
-        estimated_clients = int(addressable_market * 0.01)
-        
-        self.logger.info(f"Estimated market size: {estimated_clients} potential clients")
+        estimated_clients = _estimate_clients(niche)
+        logger.info("Estimated market size: %d potential clients", estimated_clients)
         return estimated_clients
     
-    def _analyze_competition(self, niche: str) -> str:
-        """Analyze competition level in the niche"""
+    def _analyze_niche(self, niche: str, fallback: bool = False) -> Tuple[int, str, str]:
+        """Market size, competition level and growth potential for a niche
+        
+        Lookup errors propagate unless fallback is set; then each lookup
+        falls back to 'medium' on its own, so one failure does not discard
+        the other's result.
+        """
+        market_size = self._estimate_market_size(niche)
+        
         try:
-            # Mock competition analysis - in reality, this would use APIs
-            competitors = self._find_competitors(niche)
-            
-            if len(competitors) < 10:
-                return 'low'
-            elif len(competitors) < 50:
-                return 'medium'
-            else:
-                return 'high'
-                
+            competition_level = self._competition_level(self._find_competitors(niche))
         except Exception as e:
-            self.logger.error(f"Competition analysis error: {e}")
-            return 'medium'  # Default assumption
-    
-    def _calculate_growth_potential(self, niche: str) -> str:
-        """Calculate growth potential based on market trends"""
+            if not fallback:
+                raise
+            logger.error("Competition analysis error: %s", e)
+            competition_level = 'medium'  # Default assumption
+        
         try:
-            trends = self._get_market_trends(niche)
-            growth_rate = trends.get('growth_rate', 15)
-            
-            if growth_rate > 25:
-                return 'very high'
-            elif growth_rate > 15:
-                return 'high'
-            elif growth_rate > 5:
-                return 'medium'
-            else:
-                return 'low'
-                
+            growth_potential = self._growth_potential(self._get_market_trends(niche))
         except Exception as e:
-            self.logger.error(f"Growth potential analysis error: {e}")
+            if not fallback:
+                raise
+            logger.error("Growth potential analysis error: %s", e)
+            growth_potential = 'medium'
+        
+        return market_size, competition_level, growth_potential
+    
+    @staticmethod
+    def _competition_level(competitors) -> str:
+        """Classify competition by number of competitors"""
+        if len(competitors) < 10:
+            return 'low'
+        elif len(competitors) < 50:
+            return 'medium'
+        else:
+            return 'high'
+    
+    @staticmethod
+    def _growth_potential(trends: Mapping) -> str:
+        """Classify growth potential from the trend growth rate"""
+        growth_rate = trends.get('growth_rate', 15)
+        
+        if growth_rate > 25:
+            return 'very high'
+        elif growth_rate > 15:
+            return 'high'
+        elif growth_rate > 5:
             return 'medium'
+        else:
+            return 'low'
     
-    def _find_competitors(self, niche: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _find_competitors(niche: str) -> Tuple[str, ...]:
         """Find competitors in the niche"""
         # Mock data - in reality, use web scraping or APIs
-        return [
+        return (
             'digitalagency.co.za', 'leadsolutions.co.za', 'marketingpros.co.za',
             'growthhackers.co.za', 'smespecialists.co.za'
-        ]
+        )
     
-    def _get_market_trends(self, niche: str) -> Dict:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_market_trends(niche: str) -> Mapping:
         """Get market trends data"""
         # Mock data - integrate with actual APIs in production
-        return {
+        return MappingProxyType({
             'growth_rate': 28,
             'digital_adoption': 65,
             'market_maturity': 'growing',
             'investment_trend': 'increasing'
-        }
+        })
     
     def generate_revenue_projections(self, current_clients: int, growth_rate: float = 0.3) -> Dict:
         """Generate revenue projections"""
-        projections = {}
-        monthly_clients = current_clients
         monthly_rate = 25000  # ZAR
         
-        for month in range(1, 13):
-            monthly_revenue = monthly_clients * monthly_rate
-            projections[f'month_{month}'] = {
-                'clients': int(monthly_clients),
-                'revenue': monthly_revenue,
-                'cumulative_revenue': sum(proj['revenue'] for proj in projections.values()) + monthly_revenue
-            }
-            monthly_clients *= (1 + growth_rate)  # Compound growth
+        # Compound growth as one cumulative product, then running totals
+        clients_arr = np.cumprod(np.r_[float(current_clients), np.full(11, 1 + growth_rate)])
+        revenue_arr = clients_arr * monthly_rate
+        cum_arr = np.cumsum(revenue_arr)
         
-        return projections
+        return {
+            f'month_{month}': {
+                'clients': clients,
+                'revenue': revenue,
+                'cumulative_revenue': cumulative
+            }
+            for month, clients, revenue, cumulative in zip(range(1, 13), clients_arr.astype(int).tolist(),
+                                                           revenue_arr.tolist(), cum_arr.tolist())
+        }
@@ -0,0 +1,58 @@
+"""
+Shared pytest configuration for the test suite
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+SQL_DIR = ROOT / 'data' / 'SQL'
+
+# Make the src packages importable once for every test module. The root
+# is needed too, since some modules import their siblings as src.<package>
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'src'))
+
+# Test databases are throwaway: no fsync, temp tables in RAM. The journal
+# stays in memory rather than OFF so savepoint rollbacks remain defined
+_FAST_PRAGMAS = '''
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA locking_mode=EXCLUSIVE;
+'''
+
+def _connect_memory():
+    """Autocommit in-memory connection, so statements skip implicit BEGIN/COMMIT"""
+    conn = sqlite3.connect(':memory:', isolation_level=None, check_same_thread=False)
+    conn.executescript(_FAST_PRAGMAS)
+    return conn
+
+@pytest.fixture(scope='session')
+def seeded_db():
+    """Schema and sample data loaded once per session, used as a clone source"""
+    template = _connect_memory()
+    for script in ('schema.sql', 'sample_data.sql'):
+        template.executescript((SQL_DIR / script).read_text())
+    yield template
+    template.close()
+
+@pytest.fixture(scope='module')
+def module_db(seeded_db):
+    """Copy of the seeded database shared by every test in a module; use db for writes"""
+    db = _connect_memory()
+    # Page-level copy; no SQL is re-parsed
+    seeded_db.backup(db)
+    yield db
+    db.close()
+
+@pytest.fixture
+def db(module_db):
+    """Module database with each test's changes rolled back via a savepoint"""
+    module_db.execute("SAVEPOINT test_sp")
+    yield module_db
+    module_db.execute("ROLLBACK TO test_sp")
+    module_db.execute("RELEASE test_sp")
@@ -3,66 +3,70 @@
 Tests for AI agents components
 """
 
-import unittest
-import sys
-from pathlib import Path
+import sqlite3
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+import pytest
 
 from ai_agents import LeadGenerator, OutreachAgent
-from ai_helpers import EmailManager, DatabaseHandler
-import sqlite3
+from ai_helpers import EmailManager
+
+@pytest.fixture(scope='module')
+def agent_db():
+    """One in-memory database and connection shared by every agent test"""
+    db = sqlite3.connect('file:agents_test?mode=memory&cache=shared', uri=True)
+    db.execute('PRAGMA journal_mode=MEMORY')
+    db.execute('PRAGMA synchronous=OFF')
+    yield db
+    db.close()
+
+@pytest.fixture
+def agent_txn(agent_db):
+    """Run each test inside a transaction that is rolled back afterwards"""
+    agent_db.execute('BEGIN')
+    yield agent_db
+    # Agents may commit on their own; only roll back what is still open
+    if agent_db.in_transaction:
+        agent_db.rollback()
+
+@pytest.fixture(scope='module')
+def email_manager():
+    email_config = {
+        'smtp_server': 'test',
+        'username': 'test',
+        'password': 'test'
+    }
+    return EmailManager(email_config)
+
+@pytest.fixture
+def lead_generator(agent_txn, email_manager):
+    return LeadGenerator(agent_txn, email_manager)
+
+@pytest.fixture
+def outreach_agent(agent_txn, email_manager):
+    return OutreachAgent(email_manager, agent_txn)
+
+def test_generate_leads(lead_generator):
+    leads = lead_generator.generate_leads(target_companies=5)
+    assert isinstance(leads, list)
+    assert len(leads) <= 5
+
+    if leads:
+        lead = leads[0]
+        assert 'company_name' in lead
+        assert 'lead_score' in lead
 
-class TestLeadGenerator(unittest.TestCase):
-    
-    def setUp(self):
-        self.db = sqlite3.connect(':memory:')
-        email_config = {
-            'smtp_server': 'test',
-            'username': 'test',
-            'password': 'test'
-        }
-        email_manager = EmailManager(email_config)
-        self.lead_generator = LeadGenerator(self.db, email_manager)
-    
-    def test_generate_leads(self):
-        leads = self.lead_generator.generate_leads(target_companies=5)
-        self.assertIsInstance(leads, list)
-        self.assertLessEqual(len(leads), 5)
-        
-        if leads:
-            lead = leads[0]
-            self.assertIn('company_name', lead)
-            self.assertIn('lead_score', lead)
-    
-    def test_qualify_leads(self):
-        # First generate some leads
-        leads = self.lead_generator.generate_leads(target_companies=3)
-        qualified_leads = self.lead_generator.qualify_leads(leads)
-        self.assertIsInstance(qualified_leads, list)
+def test_qualify_leads(lead_generator):
+    # First generate some leads
+    leads = lead_generator.generate_leads(target_companies=3)
+    qualified_leads = lead_generator.qualify_leads(leads)
+    assert isinstance(qualified_leads, list)
 
-class TestOutreachAgent(unittest.TestCase):
-    
-    def setUp(self):
-        self.db = sqlite3.connect(':memory:')
-        email_config = {
-            'smtp_server': 'test',
-            'username': 'test', 
-            'password': 'test'
-        }
-        email_manager = EmailManager(email_config)
-        self.outreach_agent = OutreachAgent(email_manager, self.db)
-    
-    def test_create_follow_up_sequence(self):
-        lead = {'id': 'test_lead', 'company_name': 'Test Company'}
-        follow_ups = self.outreach_agent.create_follow_up_sequence(lead, '2024-01-01')
-        self.assertIsInstance(follow_ups, list)
-        
-        if follow_ups:
-            follow_up = follow_ups[0]
-            self.assertIn('days_after_initial', follow_up)
-            self.assertIn('type', follow_up)
+def test_create_follow_up_sequence(outreach_agent):
+    lead = {'id': 'test_lead', 'company_name': 'Test Company'}
+    follow_ups = outreach_agent.create_follow_up_sequence(lead, '2024-01-01')
+    assert isinstance(follow_ups, list)
 
-if __name__ == '__main__':
-    unittest.main()
+    if follow_ups:
+        follow_up = follow_ups[0]
+        assert 'days_after_initial' in follow_up
+        assert 'type' in follow_up
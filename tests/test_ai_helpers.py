@@ -3,89 +3,121 @@
 Tests for AI helpers components
 """
 
-import unittest
-import sys
-from pathlib import Path
+import socket
+from unittest import mock
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+import pytest
 
 from ai_helpers import EmailManager, DatabaseHandler, APIClient, ReportGenerator
-import sqlite3
-
-class TestEmailManager(unittest.TestCase):
-    
-    def setUp(self):
-        config = {
-            'smtp_server': 'test.server.com',
-            'smtp_port': 587,
-            'username': 'test@example.com',
-            'password': 'testpass',
-            'use_tls': True
-        }
-        self.email_manager = EmailManager(config)
-    
-    def test_validate_email(self):
-        self.assertTrue(self.email_manager.validate_email('test@example.com'))
-        self.assertFalse(self.email_manager.validate_email('invalid-email'))
-    
-    def test_create_email_template(self):
-        variables = {'name': 'John', 'company_name': 'Test Corp'}
-        template = self.email_manager.create_email_template('welcome', variables)
-        self.assertIsInstance(template, str)
-        self.assertIn('John', template)
-        self.assertIn('Test Corp', template)
-
-class TestDatabaseHandler(unittest.TestCase):
-    
-    def setUp(self):
-        config = {}
-        self.db_handler = DatabaseHandler(config, use_sqlite=True)
-        self.db_handler.connect()
-    
-    def test_execute_query(self):
-        result = self.db_handler.execute_query("SELECT 1 as test")
-        self.assertIsInstance(result, list)
-    
-    def test_insert_lead(self):
-        lead_data = {
-            'id': 'test_lead_001',
-            'company_name': 'Test Company',
-            'contact_email': 'test@example.com',
-            'industry': 'Technology',
-            'size': '10-50',
-            'location': 'Test City',
-            'lead_score': 7.5,
-            'status': 'new',
-            'priority': 'medium',
-            'source': 'test'
-        }
-        success = self.db_handler.insert_lead(lead_data)
-        self.assertTrue(success)
-
-class TestAPIClient(unittest.TestCase):
-    
-    def setUp(self):
-        api_keys = {'test_key': 'test_value'}
-        self.api_client = APIClient(api_keys)
-    
-    def test_test_api_connectivity(self):
-        # This is a mock test since we're not making real API calls
-        connectivity = self.api_client.test_api_connectivity()
-        self.assertIsInstance(connectivity, dict)
-        self.assertIn('tests', connectivity)
-
-class TestReportGenerator(unittest.TestCase):
-    
-    def setUp(self):
-        self.db = sqlite3.connect(':memory:')
-        self.report_generator = ReportGenerator(self.db)
-    
-    def test_generate_daily_report(self):
-        report = self.report_generator.generate_daily_report()
-        self.assertIsInstance(report, dict)
-        self.assertIn('executive_summary', report)
-        self.assertIn('lead_metrics', report)
-
-if __name__ == '__main__':
-    unittest.main()
+
+@pytest.fixture(scope='module')
+def email_manager():
+    config = {
+        'smtp_server': 'test.server.com',
+        'smtp_port': 587,
+        'username': 'test@example.com',
+        'password': 'testpass',
+        'use_tls': True
+    }
+    return EmailManager(config)
+
+@pytest.fixture
+def db_handler():
+    # Shared-cache in-memory database: nothing touches disk, and it is
+    # private to this worker process and dropped when the handler closes
+    config = {'sqlite_path': 'file::memory:?cache=shared', 'uri': True}
+    handler = DatabaseHandler(config, use_sqlite=True)
+    handler.connect()
+    handler.connection.execute("PRAGMA journal_mode=MEMORY")
+    handler.connection.execute("PRAGMA synchronous=OFF")
+    yield handler
+    handler.close()
+
+@pytest.fixture
+def api_client():
+    client = APIClient({'test_key': 'test_value'})
+
+    # All HTTP goes through the session; answer it in memory, and fail
+    # fast on any other socket use instead of waiting on a timeout
+    response = mock.Mock(status_code=200, content=b'{}')
+    response.json.return_value = {}
+    with mock.patch.object(client.session, 'request', return_value=response), \
+            mock.patch.object(socket, 'create_connection', side_effect=OSError('network disabled in tests')):
+        yield client
+
+@pytest.fixture
+def report_generator(db):
+    # Shared template database; each test's changes roll back to a savepoint
+    return ReportGenerator(db)
+
+def test_validate_email(email_manager):
+    assert email_manager.validate_email('test@example.com')
+    assert not email_manager.validate_email('invalid-email')
+
+def test_create_email_template(email_manager):
+    variables = {'name': 'John', 'company_name': 'Test Corp'}
+    template = email_manager.create_email_template('welcome', variables)
+    assert isinstance(template, str)
+    assert 'John' in template
+    assert 'Test Corp' in template
+
+def test_database_is_in_memory(db_handler):
+    databases = db_handler.connection.execute("PRAGMA database_list").fetchall()
+    assert databases[0][2] == ''
+
+def test_execute_query(db_handler):
+    result = db_handler.execute_query("SELECT 1 as test")
+    assert isinstance(result, list)
+
+def test_insert_lead(db_handler):
+    lead_data = {
+        'id': 'test_lead_001',
+        'company_name': 'Test Company',
+        'contact_email': 'test@example.com',
+        'industry': 'Technology',
+        'size': '10-50',
+        'location': 'Test City',
+        'lead_score': 7.5,
+        'status': 'new',
+        'priority': 'medium',
+        'source': 'test'
+    }
+    assert db_handler.insert_lead(lead_data)
+
+def test_insert_leads(db_handler):
+    leads = [{
+        'id': f'test_lead_{i:03d}',
+        'company_name': f'Test Company {i}',
+        'contact_email': f'test{i}@example.com',
+        'industry': 'Technology',
+        'size': '10-50',
+        'location': 'Test City',
+        'lead_score': 7.5,
+        'status': 'new',
+        'priority': 'medium',
+        'source': 'test'
+    } for i in range(50)]
+    assert db_handler.insert_leads(leads)
+    assert db_handler.execute_query("SELECT COUNT(*) FROM leads") == [(50,)]
+
+def test_test_api_connectivity(api_client):
+    # This is a mock test since we're not making real API calls
+    connectivity = api_client.test_api_connectivity()
+    assert isinstance(connectivity, dict)
+    assert 'tests' in connectivity
+
+def test_make_request_uses_mocked_session(api_client):
+    assert api_client.make_request('https://api.example.com/status') == {}
+    api_client.session.request.assert_called_once()
+
+def test_generate_daily_report(report_generator):
+    # The DailyReport TypedDict return annotation covers the report's type
+    report = report_generator.generate_daily_report()
+    assert 'executive_summary' in report
+    assert 'lead_metrics' in report
+
+def test_daily_report_reads_sample_data(report_generator, db):
+    (total_leads,), = db.execute("SELECT COUNT(*) FROM leads").fetchall()
+    report = report_generator.generate_daily_report()
+    assert total_leads > 0
+    assert report['lead_metrics']['total_leads'] == total_leads
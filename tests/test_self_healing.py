@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for self-healing components
+"""
+
+import sqlite3
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from self_healing.auto_recovery import AutoRecovery
+from self_healing.system_monitor import SystemMonitor
+
+@pytest.fixture
+def system_monitor():
+    return SystemMonitor()
+
+def test_collect_system_metrics_keeps_wall_clock_timestamp(system_monitor):
+    metrics = system_monitor.collect_system_metrics()
+    assert isinstance(metrics['timestamp'], datetime)
+    assert '_mono' not in metrics
+    assert list(system_monitor.performance_metrics.values()) == [metrics]
+
+@pytest.fixture
+def auto_recovery():
+    recovery = AutoRecovery(sqlite3.connect(':memory:'))
+    yield recovery
+    recovery.db.close()
+
+def test_recovery_gives_up_after_max_attempts_and_logs_once(auto_recovery, caplog):
+    failing = mock.Mock(return_value=False)
+    auto_recovery._recovery_fns['email_service'] = failing
+    for _ in range(auto_recovery.max_recovery_attempts):
+        assert not auto_recovery.attempt_service_recovery('email_service', {})
+    assert failing.call_count == auto_recovery.max_recovery_attempts
+
+    caplog.clear()
+    for _ in range(3):
+        assert not auto_recovery.attempt_service_recovery('email_service', {})
+    assert failing.call_count == auto_recovery.max_recovery_attempts
+    assert [r.message for r in caplog.records].count(
+        "Max recovery attempts reached for email_service. Manual intervention required.") == 1
+    assert auto_recovery.generate_health_report()['awaiting_intervention'] == ['email_service']
+
+def test_reset_recovery_attempts_re_enables_recovery(auto_recovery):
+    recover = mock.Mock(return_value=False)
+    auto_recovery._recovery_fns['email_service'] = recover
+    for _ in range(auto_recovery.max_recovery_attempts + 1):
+        auto_recovery.attempt_service_recovery('email_service', {})
+
+    auto_recovery.reset_recovery_attempts('email_service')
+    recover.return_value = True
+    assert auto_recovery.attempt_service_recovery('email_service', {})
+    assert recover.call_count == auto_recovery.max_recovery_attempts + 1
+    assert auto_recovery.generate_health_report()['awaiting_intervention'] == []
+
+def test_health_report_timestamp_is_datetime(auto_recovery):
+    assert isinstance(auto_recovery.generate_health_report()['timestamp'], datetime)
+
+def test_database_probe_reopens_cursor_after_recovery(auto_recovery):
+    assert auto_recovery._check_database_health()['healthy']
+    old_cursor = auto_recovery._hc_cursor
+
+    with mock.patch('self_healing.auto_recovery.time.sleep'):
+        assert auto_recovery._recover_database()
+    assert not auto_recovery._check_database_health()['healthy']
+
+    auto_recovery.db = sqlite3.connect(':memory:')
+    assert auto_recovery._check_database_health()['healthy']
+    assert auto_recovery._hc_cursor is not old_cursor
+    assert auto_recovery._hc_cursor.connection is auto_recovery.db
+
+def test_deep_check_runs_every_interval_cycles(auto_recovery):
+    auto_recovery.deep_check_interval = 3
+    reports = [auto_recovery.run_health_check_cycle() for _ in range(2 * auto_recovery.deep_check_interval)]
+    assert ['database_integrity' in report for report in reports] == [False, False, True] * 2
+    assert reports[2]['database_integrity']['healthy']
+
+def test_deep_check_failure_is_reported(auto_recovery, caplog):
+    auto_recovery.deep_check_interval = 1
+    auto_recovery.db.close()
+    with mock.patch('self_healing.auto_recovery.time.sleep'):
+        report = auto_recovery.run_health_check_cycle()
+    assert not report['database_integrity']['healthy']
+    assert any(r.message.startswith("Database integrity check failed") for r in caplog.records)
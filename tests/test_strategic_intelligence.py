@@ -3,65 +3,173 @@
 Tests for strategic intelligence components
 """
 
-import unittest
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
-
-from strategic_intelligence import MarketAnalyzer, CompetitorTracker, TrendPredictor
-import sqlite3
-
-class TestMarketAnalyzer(unittest.TestCase):
-    
-    def setUp(self):
-        # Create in-memory database for testing
-        self.db = sqlite3.connect(':memory:')
-        self.market_analyzer = MarketAnalyzer(self.db)
-    
-    def test_analyze_sa_market(self):
-        analysis = self.market_analyzer.analyze_sa_market()
-        self.assertIsInstance(analysis, dict)
-        self.assertIn('economic_indicators', analysis)
-        self.assertIn('market_health_score', analysis)
-    
-    def test_get_market_share_estimate(self):
-        estimates = self.market_analyzer.get_market_share_estimate(10000)
-        self.assertIsInstance(estimates, dict)
-        self.assertIn('market_share_estimates', estimates)
-
-class TestCompetitorTracker(unittest.TestCase):
-    
-    def setUp(self):
-        self.db = sqlite3.connect(':memory:')
-        self.competitor_tracker = CompetitorTracker(self.db)
-    
-    def test_add_competitor(self):
-        initial_count = len(self.competitor_tracker.competitors)
-        self.competitor_tracker.add_competitor('test.com', 'Test Competitor', ['SEO'])
-        self.assertEqual(len(self.competitor_tracker.competitors), initial_count + 1)
-    
-    def test_analyze_competitor_landscape(self):
-        analysis = self.competitor_tracker.analyze_competitor_landscape()
-        self.assertIsInstance(analysis, dict)
-        self.assertIn('total_competitors', analysis)
-
-class TestTrendPredictor(unittest.TestCase):
-    
-    def setUp(self):
-        self.db = sqlite3.connect(':memory:')
-        self.trend_predictor = TrendPredictor(self.db)
-    
-    def test_predict_revenue_growth(self):
-        projections = self.trend_predictor.predict_revenue_growth(5, 0.3)
-        self.assertIsInstance(projections, dict)
-        self.assertIn('projections', projections)
-    
-    def test_identify_seasonal_patterns(self):
-        patterns = self.trend_predictor.identify_seasonal_patterns()
-        self.assertIsInstance(patterns, dict)
-        self.assertIn('q1_jan_mar', patterns)
-
-if __name__ == '__main__':
-    unittest.main()
+import asyncio
+import copy
+import json
+from unittest import mock
+
+import pytest
+
+# Analyzers share the module database; each test runs inside a savepoint
+pytestmark = pytest.mark.usefixtures('db')
+
+@pytest.fixture(scope='module')
+def market_analyzer(module_db):
+    # Imported here so a run selecting one analyzer's tests skips the others
+    from strategic_intelligence import MarketAnalyzer
+    return MarketAnalyzer(module_db)
+
+@pytest.fixture(scope='module')
+def competitor_tracker(module_db):
+    from strategic_intelligence import CompetitorTracker
+    tracker = CompetitorTracker(module_db)
+    yield tracker
+    tracker.close()
+
+@pytest.fixture
+def fresh_tracker(db):
+    # Own tracker for tests that change its competitor list
+    from strategic_intelligence import CompetitorTracker
+    tracker = CompetitorTracker(db)
+    yield tracker
+    tracker.close()
+
+@pytest.fixture(scope='module')
+def trend_predictor(module_db):
+    from strategic_intelligence import TrendPredictor
+    return TrendPredictor(module_db)
+
+@pytest.mark.parametrize('method_name,args,expected_key', [
+    ('analyze_sa_market', (), 'economic_indicators'),
+    ('analyze_sa_market', (), 'market_health_score'),
+    ('get_market_share_estimate', (10000,), 'market_share_estimates')
+])
+def test_market_analyzer_report(market_analyzer, method_name, args, expected_key):
+    result = getattr(market_analyzer, method_name)(*args)
+    assert isinstance(result, dict)
+    assert expected_key in result
+
+def test_analyze_sa_market_recommendations(market_analyzer):
+    analysis = market_analyzer.analyze_sa_market()
+    assert len(analysis['recommendations']) > 0
+    assert 0 <= analysis['market_health_score'] <= 100
+
+def test_analyze_sa_market_is_memoized(market_analyzer):
+    market_analyzer.invalidate()
+    with mock.patch.object(market_analyzer, '_analyze_sa_market',
+                           wraps=market_analyzer._analyze_sa_market) as compute:
+        market_analyzer.analyze_sa_market()
+        market_analyzer.analyze_sa_market()
+        assert compute.call_count == 1
+        market_analyzer.invalidate()
+        market_analyzer.analyze_sa_market()
+        assert compute.call_count == 2
+
+def test_analyze_sa_market_returns_fresh_copies(market_analyzer):
+    first = market_analyzer.analyze_sa_market()
+    first['recommendations'].append('mutated')
+    first['opportunity_areas'][0]['potential'] = 'mutated'
+    second = market_analyzer.analyze_sa_market()
+    assert 'mutated' not in second['recommendations']
+    assert second['opportunity_areas'][0]['potential'] != 'mutated'
+    assert second['timestamp'] >= first['timestamp']
+
+def _baseline_health_score(confidence, penetration, optimism, ecommerce_growth):
+    """The original scalar formula from analyze_sa_market"""
+    return (confidence / 100 * 25 + penetration / 100 * 25 + optimism / 100 * 25
+            + min(ecommerce_growth / 50 * 25, 25))
+
+def test_score_market_segments_matches_scalar_score(market_analyzer):
+    rows = [[45, 72, 65, 25], [80, 90, 70, 60], [0, 0, 0, 0]]
+    scores = market_analyzer.score_market_segments(rows)
+    assert scores[0] == pytest.approx(58.0)
+    assert scores[0] == pytest.approx(market_analyzer.analyze_sa_market()['market_health_score'])
+    assert scores == pytest.approx([_baseline_health_score(*row) for row in rows])
+    assert market_analyzer.score_market_segments([]) == []
+
+def test_market_analyzer_results_are_plain_data(market_analyzer):
+    analysis = market_analyzer.analyze_sa_market()
+    copy.deepcopy(analysis)
+    restored = json.loads(json.dumps(analysis, default=str))
+    assert restored['sme_sentiment']['challenges'] == list(analysis['sme_sentiment']['challenges'])
+    analysis['economic_indicators']['inflation'] = 0
+    assert market_analyzer.analyze_sa_market()['economic_indicators']['inflation'] != 0
+
+    strategies = market_analyzer.track_competitor_strategy(['a.co.za', 'b.co.za'])
+    copy.deepcopy(strategies)
+    json.dumps(strategies)
+
+def test_add_competitor(fresh_tracker):
+    initial_count = len(fresh_tracker.competitors)
+    fresh_tracker.add_competitor('test.com', 'Test Competitor', ['SEO'])
+    assert len(fresh_tracker.competitors) == initial_count + 1
+
+def test_track_competitor_changes_isolates_failures(fresh_tracker, caplog):
+    fresh_tracker.add_competitor('a.co.za', 'A', ['SEO'])
+    fresh_tracker.add_competitor('broken.co.za', 'Broken', ['SEO'])
+    fresh_tracker.add_competitor('c.co.za', 'C', ['SEO'])
+    analyze = fresh_tracker._analyze_competitor_website
+
+    def analyze_or_fail(domain):
+        if domain == 'broken.co.za':
+            raise ConnectionError('unreachable')
+        return analyze(domain)
+
+    with mock.patch.object(fresh_tracker, '_analyze_competitor_website', side_effect=analyze_or_fail), \
+            mock.patch.object(fresh_tracker, '_get_previous_analysis', return_value={'services': []}):
+        changes = fresh_tracker.track_competitor_changes()
+
+    assert [change['competitor'] for change in changes] == ['A', 'C']
+    assert [c['last_checked'] is not None for c in fresh_tracker.competitors] == [True, False, True]
+    assert any('Broken' in r.getMessage() for r in caplog.records)
+
+def test_track_competitor_changes_rejects_running_loop(fresh_tracker):
+    async def call_sync_wrapper():
+        return fresh_tracker.track_competitor_changes()
+
+    with pytest.raises(RuntimeError, match='track_competitor_changes_async'):
+        asyncio.run(call_sync_wrapper())
+    assert asyncio.run(fresh_tracker.track_competitor_changes_async()) == []
+
+@pytest.mark.parametrize('fixture_name,method_name,args,expected_key', [
+    ('competitor_tracker', 'analyze_competitor_landscape', (), 'total_competitors'),
+    ('trend_predictor', 'predict_revenue_growth', (5, 0.3), 'projections'),
+    ('trend_predictor', 'identify_seasonal_patterns', (), 'q1_jan_mar')
+])
+def test_report_has_key(request, fixture_name, method_name, args, expected_key):
+    result = getattr(request.getfixturevalue(fixture_name), method_name)(*args)
+    assert isinstance(result, dict)
+    assert expected_key in result
+
+def test_trend_predictor_results_are_plain_data(trend_predictor):
+    patterns = trend_predictor.identify_seasonal_patterns()
+    json.dumps(patterns)
+    patterns['q1_jan_mar']['characteristics'].append('mutated')
+    assert 'mutated' not in trend_predictor.identify_seasonal_patterns()['q1_jan_mar']['characteristics']
+
+    trends = trend_predictor.predict_market_trends()
+    copy.deepcopy(trends)
+    json.dumps(trends, default=str)
+    assert isinstance(trends['risk_factors'][0], dict)
+
+def test_sample_data_to_dataframe(trend_predictor):
+    sample = trend_predictor._generate_sample_data()
+    data = sample.to_dataframe()
+    assert list(data.columns) == ['date', 'digital_adoption', 'sme_spending', 'lead_demand']
+    assert len(data) == len(sample.dates)
+    assert trend_predictor.predict_market_trends(data)['digital_adoption_trend']['trend'] == 'increasing'
+
+def test_predict_revenue_growth_cumulative(trend_predictor):
+    projections = trend_predictor.predict_revenue_growth(5, 0.3)['projections']
+    running_total = 0
+    for month in range(1, 13):
+        running_total += projections[f'month_{month}']['revenue']
+        assert projections[f'month_{month}']['cumulative_revenue'] == pytest.approx(running_total)
+
+def test_predict_revenue_growth_batch_matches_single(trend_predictor):
+    batch = trend_predictor.predict_revenue_growth_batch([5, 12], [0.3, 0.1])
+    assert batch['cumulative_revenue'].shape == (2, 12)
+    for row, (clients, rate) in enumerate([(5, 0.3), (12, 0.1)]):
+        single = trend_predictor.predict_revenue_growth(clients, rate)
+        assert batch['total_year_revenue'][row] == pytest.approx(single['total_year_revenue'])
+        assert int(batch['clients'][row, -1]) == single['clients_end_year']
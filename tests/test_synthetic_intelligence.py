@@ -3,72 +3,151 @@
 Tests for synthetic intelligence components
 """
 
-import unittest
-import sys
-from pathlib import Path
+import copy
+from unittest import mock
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+import pytest
 
 from synthetic_intelligence import ContentGenerator, StrategyAnalyzer, DecisionEngine
+from synthetic_intelligence.content_generator import Lead
+from synthetic_intelligence.decision_engine import Effort, Impact
+from synthetic_intelligence.strategy_analyzer import _estimate_clients
 
-class TestContentGenerator(unittest.TestCase):
-    
-    def setUp(self):
-        self.content_gen = ContentGenerator()
-    
-    def test_generate_email_subject(self):
-        company_data = {'company_name': 'Test Company'}
-        subject = self.content_gen.generate_email_subject(company_data)
-        self.assertIsInstance(subject, str)
-        self.assertIn('Test Company', subject)
-    
-    def test_generate_email_body(self):
-        lead_data = {
-            'company_name': 'Test Company',
-            'contact_name': 'John Doe',
-            'industry': 'Technology'
-        }
-        body = self.content_gen.generate_email_body(lead_data, 'cold')
-        self.assertIsInstance(body, str)
-        self.assertIn('Test Company', body)
-
-class TestStrategyAnalyzer(unittest.TestCase):
-    
-    def setUp(self):
-        self.strategy_analyzer = StrategyAnalyzer({})
-    
-    def test_analyze_market_opportunity(self):
-        analysis = self.strategy_analyzer.analyze_market_opportunity('Technology')
-        self.assertIsInstance(analysis, dict)
-        self.assertIn('market_size', analysis)
-        self.assertIn('recommended_strategy', analysis)
-    
-    def test_estimate_market_size(self):
-        market_size = self.strategy_analyzer._estimate_market_size('Technology')
-        self.assertIsInstance(market_size, int)
-        self.assertGreater(market_size, 0)
-
-class TestDecisionEngine(unittest.TestCase):
-    
-    def setUp(self):
-        self.decision_engine = DecisionEngine()
-    
-    def test_make_strategic_decision(self):
-        context = {'revenue_gap': 600000}
-        goals = {'target_revenue': 1000000}
-        constraints = {}
-        
-        decision = self.decision_engine.make_strategic_decision(context, goals, constraints)
-        self.assertIsInstance(decision, dict)
-        self.assertIn('recommended_actions', decision)
-    
-    def test_evaluate_agent_performance(self):
-        agent_metrics = {
-            'lead_generator': {'success_rate': 0.2, 'response_time': 70, 'error_rate': 0.15}
-        }
-        recommendations = self.decision_engine.evaluate_agent_performance(agent_metrics)
-        self.assertIsInstance(recommendations, list)
-
-if __name__ == '__main__':
-    unittest.main()
+# Read-only for these tests, so one instance serves the whole module
+@pytest.fixture(scope='module')
+def content_gen():
+    return ContentGenerator()
+
+@pytest.fixture(scope='module')
+def strategy_analyzer():
+    return StrategyAnalyzer({})
+
+@pytest.fixture(scope='module')
+def decision_engine():
+    return DecisionEngine()
+
+def test_generate_email_subject(content_gen):
+    company_data = {'company_name': 'Test Company'}
+    subject = content_gen.generate_email_subject(company_data)
+    assert isinstance(subject, str)
+    assert 'Test Company' in subject
+
+def test_generate_email_subjects_batch(content_gen):
+    companies = [{'company_name': f'Company {i}'} for i in range(10)]
+    subjects = content_gen.generate_email_subjects_batch(companies)
+    assert len(subjects) == 10
+    for company, subject in zip(companies, subjects):
+        assert company['company_name'] in subject
+
+def test_generate_value_propositions_batch(content_gen):
+    single = {content_gen.generate_value_proposition() for _ in range(200)}
+    batch = content_gen.generate_value_propositions_batch(200)
+    assert len(batch) == 200
+    assert set(batch) == single == set(content_gen.templates['value_propositions'])
+    assert content_gen.generate_value_propositions_batch(0) == []
+
+def test_generate_email_body(content_gen):
+    lead_data = {
+        'company_name': 'Test Company',
+        'contact_name': 'John Doe',
+        'industry': 'Technology'
+    }
+    body = content_gen.generate_email_body(lead_data, 'cold')
+    assert isinstance(body, str)
+    assert 'Test Company' in body
+
+def test_generate_emails_from_leads(content_gen):
+    leads = [Lead('Test Company', 'John Doe', 'Technology'), Lead('Other Company')]
+    bodies = list(content_gen.generate_emails(iter(leads)))
+    assert len(bodies) == 2
+    assert bodies[0] == content_gen.generate_email_body(
+        {'company_name': 'Test Company', 'contact_name': 'John Doe', 'industry': 'Technology'})
+    assert 'Dear Team at Other Company' in bodies[1]
+
+def test_templates_are_loaded_once(content_gen):
+    hits = ContentGenerator._load_templates.cache_info().hits
+    other = ContentGenerator()
+    assert ContentGenerator._load_templates.cache_info().hits > hits
+    assert other.templates is content_gen.templates
+
+def test_analyze_market_opportunity(strategy_analyzer):
+    analysis = strategy_analyzer.analyze_market_opportunity('Technology')
+    assert isinstance(analysis, dict)
+    assert 'market_size' in analysis
+    assert 'recommended_strategy' in analysis
+
+def test_analyze_market_opportunity_returns_fresh_copies(strategy_analyzer):
+    cache_info = strategy_analyzer._analyze_market_opportunity_cached.cache_info
+    first = strategy_analyzer.analyze_market_opportunity('Technology')
+    hits = cache_info().hits
+    first['key_opportunities'].append('mutated')
+    first['risk_assessment']['market_risk'] = 'mutated'
+    second = strategy_analyzer.analyze_market_opportunity('Technology')
+    assert 'mutated' not in second['key_opportunities']
+    assert second['risk_assessment']['market_risk'] == 'medium'
+    assert cache_info().hits == hits + 1
+
+def test_niche_lookups_fall_back_independently():
+    analyzer = StrategyAnalyzer({})
+    with mock.patch.object(analyzer, '_find_competitors', side_effect=ConnectionError('down')):
+        analysis = analyzer.analyze_market_opportunity('Logistics')
+    assert analysis['competition_level'] == 'medium'
+    assert analysis['growth_potential'] == 'very high'
+
+def test_failed_niche_lookup_is_not_memoized():
+    analyzer = StrategyAnalyzer({})
+    with mock.patch.object(analyzer, '_get_market_trends', side_effect=ConnectionError('down')):
+        assert analyzer.analyze_market_opportunity('Retail')['growth_potential'] == 'medium'
+    assert analyzer._analyze_market_opportunity_cached.cache_info().currsize == 0
+    assert analyzer.analyze_market_opportunity('Retail')['growth_potential'] == 'very high'
+
+def test_estimate_market_size(strategy_analyzer):
+    market_size = strategy_analyzer._estimate_market_size('Technology')
+    assert isinstance(market_size, int)
+    assert market_size > 0
+
+def test_estimate_market_size_is_cached(strategy_analyzer):
+    strategy_analyzer._estimate_market_size('Consulting')
+    hits = _estimate_clients.cache_info().hits
+    strategy_analyzer._estimate_market_size('Consulting')
+    assert _estimate_clients.cache_info().hits == hits + 1
+
+def test_generate_revenue_projections_cumulative(strategy_analyzer):
+    projections = strategy_analyzer.generate_revenue_projections(5, 0.3)
+    running_total = 0
+    for month in range(1, 13):
+        running_total += projections[f'month_{month}']['revenue']
+        assert projections[f'month_{month}']['cumulative_revenue'] == pytest.approx(running_total)
+
+def test_make_strategic_decision(decision_engine):
+    context = {'revenue_gap': 600000}
+    goals = {'target_revenue': 1000000}
+    constraints = {}
+
+    decision = decision_engine.make_strategic_decision(context, goals, constraints)
+    assert isinstance(decision, dict)
+    assert 'recommended_actions' in decision
+
+def test_recommended_actions_are_caller_owned(decision_engine):
+    decision = decision_engine.make_strategic_decision({'revenue_gap': 600000}, {}, {})
+    copy.deepcopy(decision)
+    decision['recommended_actions'][0]['status'] = 'assigned'
+    again = decision_engine.make_strategic_decision({'revenue_gap': 600000}, {}, {})
+    assert 'status' not in again['recommended_actions'][0]
+
+def test_evaluate_agent_performance(decision_engine):
+    agent_metrics = {
+        'lead_generator': {'success_rate': 0.2, 'response_time': 70, 'error_rate': 0.15}
+    }
+    recommendations = decision_engine.evaluate_agent_performance(agent_metrics)
+    assert isinstance(recommendations, list)
+
+def test_prioritize_actions_accepts_enums_and_strings(decision_engine):
+    actions = [
+        {'action': 'a', 'impact': 'low', 'estimated_effort': 'high'},
+        {'action': 'b', 'impact': Impact.HIGH, 'estimated_effort': Effort.LOW},
+        {'action': 'c', 'impact': 'high', 'estimated_effort': 'low'}
+    ]
+    prioritized = decision_engine.prioritize_actions(actions)
+    assert [a['action'] for a in prioritized] == ['b', 'c', 'a']
+    assert prioritized[0]['priority_score'] == prioritized[1]['priority_score']